@@ -0,0 +1,390 @@
+"""Run the games without a display and report per-phase frame times.
+
+    python bench/headless.py ultimate platformer intro/rotate --frames 2000
+
+Every target runs its normal entry point under the SDL dummy video driver,
+with an uncapped clock and the scripted input below. Game time still
+advances by one nominal frame per frame (Clock.tick reports 1000 / framerate
+ms; ultimate runs with --fast-forward), so every frame simulates as much
+as it would at full speed. A frame is split into
+
+    events  time spent in pygame.event.get
+    update  time spent in sprite Group.update
+    draw    the rest of the frame (drawing and game logic outside groups)
+    flip    time spent in pygame.display.flip / update
+"""
+
+import argparse
+import json
+import math
+import os
+import runpy
+import sys
+import time
+from pathlib import Path
+from statistics import quantiles
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+
+ROOT = Path(__file__).resolve().parent.parent
+PHASES = ("events", "update", "draw", "flip")
+
+Coordinate = Tuple[int, int]
+
+
+class FramesDone(BaseException):
+    pass
+
+
+class Script:
+    def __init__(
+        self,
+        events: Callable[[int], Iterable[pygame.event.Event]] = None,
+        keys: Callable[[int], Set[int]] = None,
+        mouse: Callable[[int], Coordinate] = None,
+        args: Sequence[str] = (),
+    ) -> None:
+        self.events = events or (lambda frame: ())
+        self.keys = keys
+        self.mouse = mouse
+        self.args = list(args)
+
+
+class Pressed:
+    def __init__(self, keys: Set[int]) -> None:
+        self._keys = keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._keys
+
+    def __bool__(self) -> bool:
+        return True
+
+
+_Clock = pygame.time.Clock
+
+
+class UncappedClock:
+    """pygame.time.Clock that ignores the requested frame rate.
+
+    tick() still reports the nominal frame time, so games that advance by
+    the elapsed time simulate a full frame however fast the frame ran.
+    """
+
+    def __init__(self) -> None:
+        self._clock = _Clock()
+
+    def tick(self, framerate: float = 0) -> float:
+        elapsed = self._clock.tick()
+        return 1000 / framerate if framerate else elapsed
+
+    tick_busy_loop = tick
+
+    def get_time(self) -> int:
+        return self._clock.get_time()
+
+    def get_rawtime(self) -> int:
+        return self._clock.get_rawtime()
+
+    def get_fps(self) -> float:
+        return self._clock.get_fps()
+
+
+def key(k: int, unicode: str = "") -> List[pygame.event.Event]:
+    return [
+        pygame.event.Event(pygame.KEYDOWN, key=k, unicode=unicode, mod=0),
+        pygame.event.Event(pygame.KEYUP, key=k, unicode=unicode, mod=0),
+    ]
+
+
+def click(pos: Coordinate) -> List[pygame.event.Event]:
+    return [
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+        pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1),
+    ]
+
+
+def every(n: int, events: Callable[[int], List[pygame.event.Event]], offset=0):
+    return lambda frame: events(frame) if frame % n == offset else ()
+
+
+def sweep(cx: int, cy: int, r: int, period: int = 240):
+    return lambda frame: (
+        int(cx + r * math.cos(2 * math.pi * frame / period)),
+        int(cy + r * math.sin(2 * math.pi * frame / period)),
+    )
+
+
+TARGETS: Dict[str, Tuple[str, Script]] = {
+    # The start and retry buttons are both centered on (400, 200)
+    "ultimate": (
+        "ultimate/main.py",
+        Script(
+            events=lambda frame: (
+                (click((400, 200)) if frame % 300 == 1 else [])
+                + (key(pygame.K_SPACE) if frame % 40 == 0 else [])
+            ),
+            mouse=lambda frame: (400, 200),
+            # The game reads wall-clock time, not Clock.tick
+            args=["--fast-forward"],
+        ),
+    ),
+    "platformer": (
+        "platformer/src/main.py",
+        Script(
+            keys=lambda frame: {pygame.K_RIGHT if frame // 240 % 2 else pygame.K_LEFT}
+            | ({pygame.K_SPACE} if frame % 90 < 5 else set()),
+        ),
+    ),
+    "intro/animation": (
+        "intro/animation.py",
+        Script(every(30, lambda _: key(pygame.K_a))),
+    ),
+    "intro/collision": ("intro/collision.py", Script()),
+    "intro/masks": ("intro/masks.py", Script(mouse=sweep(300, 300, 150))),
+    "intro/physics": (
+        "intro/physics.py",
+        Script(every(20, lambda frame: click(sweep(300, 200, 150)(frame)))),
+    ),
+    "intro/rotate": ("intro/rotate.py", Script()),
+    "intro/shoot": (
+        "intro/shoot.py",
+        Script(every(10, lambda _: click((0, 0))), mouse=sweep(200, 300, 150)),
+    ),
+    "intro/sprite": (
+        "intro/sprite.py",
+        Script(every(15, lambda _: click((0, 0))), mouse=sweep(400, 300, 250)),
+    ),
+    "intro/text": (
+        "intro/text.py",
+        Script(
+            lambda frame: (
+                click((210, 210))
+                if frame == 1
+                else (
+                    key(pygame.K_a, "a")
+                    if frame % 5 == 0
+                    else key(pygame.K_RETURN) if frame % 101 == 0 else []
+                )
+            )
+        ),
+    ),
+    "intro/timer": ("intro/timer.py", Script(every(60, lambda _: key(pygame.K_a)))),
+    "intro/vector": (
+        "intro/vector.py",
+        Script(
+            lambda frame: (
+                [
+                    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE),
+                    pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT),
+                ]
+                if frame == 1
+                else []
+            )
+        ),
+    ),
+    "collision": ("collision/main.py", Script()),
+    "pong": (
+        "pong/main.py",
+        Script(
+            keys=lambda frame: {pygame.K_LEFT if frame // 60 % 2 else pygame.K_RIGHT}
+            | ({pygame.K_SPACE} if frame == 30 else set()),
+        ),
+    ),
+}
+
+
+class Recorder:
+    def __init__(self, script: Script, frames: int) -> None:
+        self.script = script
+        self.frames = frames
+        self.frame = 0
+        self.samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._frame_start = time.perf_counter()
+        self._injected = -1
+        self._depth = 0
+
+    def install(self) -> None:
+        self._originals = {
+            (pygame.event, "get"): pygame.event.get,
+            (pygame.display, "flip"): pygame.display.flip,
+            (pygame.display, "update"): pygame.display.update,
+            (pygame.sprite.AbstractGroup, "update"): pygame.sprite.AbstractGroup.update,
+            (pygame.time, "Clock"): pygame.time.Clock,
+            (pygame.key, "get_pressed"): pygame.key.get_pressed,
+            (pygame.mouse, "get_pos"): pygame.mouse.get_pos,
+        }
+        get = pygame.event.get
+        flip = pygame.display.flip
+        update = pygame.display.update
+        group_update = pygame.sprite.AbstractGroup.update
+        recorder = self
+
+        def _get(*args, **kwargs):
+            if recorder._injected != recorder.frame:
+                recorder._injected = recorder.frame
+                for event in recorder.script.events(recorder.frame):
+                    pygame.event.post(event)
+            with recorder.phase("events"):
+                return get(*args, **kwargs)
+
+        def _flip():
+            with recorder.phase("flip"):
+                flip()
+            recorder.end_frame()
+
+        def _update(*args, **kwargs):
+            with recorder.phase("flip"):
+                update(*args, **kwargs)
+            recorder.end_frame()
+
+        def _group_update(self, *args, **kwargs):
+            with recorder.phase("update"):
+                group_update(self, *args, **kwargs)
+
+        pygame.event.get = _get
+        pygame.display.flip = _flip
+        pygame.display.update = _update
+        pygame.sprite.AbstractGroup.update = _group_update
+        pygame.time.Clock = UncappedClock
+        if self.script.keys:
+            pygame.key.get_pressed = lambda: Pressed(self.script.keys(self.frame))
+        if self.script.mouse:
+            pygame.mouse.get_pos = lambda: self.script.mouse(self.frame)
+
+    def uninstall(self) -> None:
+        for (owner, name), value in self._originals.items():
+            setattr(owner, name, value)
+
+    def phase(self, name: str):
+        return _Phase(self, name)
+
+    def end_frame(self) -> None:
+        now = time.perf_counter()
+        total = now - self._frame_start
+        measured = sum(self._current[p] for p in PHASES if p != "draw")
+        self._current["draw"] = max(0.0, total - measured)
+        for name in PHASES:
+            self.samples[name].append(self._current[name])
+            self._current[name] = 0.0
+        self._frame_start = now
+
+        self.frame += 1
+        if self.frame >= self.frames:
+            raise FramesDone()
+
+
+class _Phase:
+    def __init__(self, recorder: Recorder, name: str) -> None:
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.recorder._depth += 1
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.recorder._depth -= 1
+        # Nested groups are already covered by the outermost call
+        if self.recorder._depth == 0:
+            self.recorder._current[self.name] += time.perf_counter() - self.start
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    if len(samples) < 2:
+        samples = samples * 2 or [0.0, 0.0]
+    cuts = quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": cuts[49] * 1000,
+        "p90": cuts[89] * 1000,
+        "p99": cuts[98] * 1000,
+        "max": max(samples) * 1000,
+    }
+
+
+def run(target: str, frames: int, warmup: int) -> Optional[Dict]:
+    entry, script = TARGETS[target]
+    path = ROOT / entry
+    workdir = path.parent
+    modules = set(sys.modules)
+
+    recorder = Recorder(script, frames + warmup)
+    recorder.install()
+    cwd, argv = os.getcwd(), sys.argv
+    os.chdir(workdir)
+    sys.path.insert(0, str(workdir))
+    sys.argv = [str(path), *script.args]
+    start = time.perf_counter()
+    try:
+        runpy.run_path(str(path), run_name="__main__")
+    except (FramesDone, SystemExit):
+        pass
+    except ImportError as e:
+        print(f"{target}: skipped ({e})", file=sys.stderr)
+        return None
+    finally:
+        elapsed = time.perf_counter() - start
+        recorder.uninstall()
+        sys.path.remove(str(workdir))
+        sys.argv = argv
+        os.chdir(cwd)
+        # Projects reuse module names (game, player, ...); libraries such as
+        # numpy cannot be imported twice, so they stay loaded
+        for name in set(sys.modules) - modules:
+            if str(getattr(sys.modules[name], "__file__", "")).startswith(str(ROOT)):
+                del sys.modules[name]
+        pygame.quit()
+
+    samples = {name: values[warmup:] for name, values in recorder.samples.items()}
+    frame_times = [sum(values) for values in zip(*samples.values())]
+    return {
+        "target": target,
+        "frames": len(frame_times),
+        "seconds": elapsed,
+        "fps": len(frame_times) / max(sum(frame_times), 1e-9),
+        "frame": percentiles(frame_times),
+        **{name: percentiles(values) for name, values in samples.items()},
+    }
+
+
+def report(result: Dict) -> None:
+    print(
+        f"{result['target']}: {result['frames']} frames, "
+        f"{result['fps']:.0f} fps ({result['seconds']:.2f}s wall)"
+    )
+    print(f"  {'phase':<8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    for name in ("frame", *PHASES):
+        stats = result[name]
+        print(
+            f"  {name:<8}"
+            + "".join(f"{stats[key]:>9.3f}" for key in ("p50", "p90", "p99", "max"))
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("targets", nargs="*", help=", ".join(TARGETS))
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args()
+    if unknown := set(args.targets) - set(TARGETS):
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    results = []
+    for target in args.targets or TARGETS:
+        result = run(target, args.frames, args.warmup)
+        if result:
+            report(result)
+            results.append(result)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from typing import Tuple
+import numpy as np
+
+
+class SweepAndPrune:
+    """Sort-and-sweep broadphase over axis-aligned boxes.
+
+    Boxes are kept sorted by their low edge on one axis. Between frames
+    they barely move, so re-sorting the previous order with a stable
+    (Timsort) sort runs in close to linear time. Each box then only pairs
+    with the boxes whose low edge falls inside its own span, and those
+    are filtered by overlap on the other axis.
+    """
+
+    def __init__(self, axis: int = 0) -> None:
+        self.axis = axis
+        self.order = np.empty(0, dtype=np.intp)
+
+    def _resort(self, keys: np.ndarray) -> np.ndarray:
+        count, known = len(keys), len(self.order)
+        if known > count:
+            self.order = np.arange(count, dtype=np.intp)
+        elif known < count:
+            # New boxes go to the end and get sorted in with the rest
+            self.order = np.concatenate(
+                (self.order, np.arange(known, count, dtype=np.intp))
+            )
+        self.order = self.order[np.argsort(keys[self.order], kind="stable")]
+        return self.order
+
+    def pairs(self, low: np.ndarray, high: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Index arrays (i, j) of boxes overlapping on both axes.
+
+        low and high are (n, 2) arrays of the boxes' min and max corners.
+        """
+        axis, other = self.axis, 1 - self.axis
+        order = self._resort(low[:, axis])
+        start = low[order, axis]
+        end = high[order, axis]
+
+        # Boxes after k in sweep order that start before k ends
+        stop = np.searchsorted(start, end, side="right")
+        counts = stop - np.arange(1, len(order) + 1)
+        counts = np.maximum(counts, 0)
+        first = np.repeat(np.arange(len(order)), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = first + 1 + offset
+
+        i, j = order[first], order[second]
+        overlap = (low[i, other] <= high[j, other]) & (low[j, other] <= high[i, other])
+        return i[overlap], j[overlap]
@@ -0,0 +1,118 @@
+"""Swept-circle continuous collision detection.
+
+Every function takes positions at the start of a step and the
+displacement over the step, and returns the time of impact as a fraction
+t of the step: 0 <= t <= 1, or inf when nothing is hit.
+
+pong/ccd.py is a symlink to this file, so it stays free of numpy.
+"""
+
+import math
+from typing import Optional, Tuple
+import pygame
+
+Vector = pygame.math.Vector2
+Hit = Tuple[float, Vector]
+
+
+def circle_circle(
+    p1: Vector, v1: Vector, r1: float, p2: Vector, v2: Vector, r2: float
+) -> float:
+    """Time of impact of two moving circles.
+
+    Circles that already overlap hit at t=0 if they are closing in, and
+    never if they are moving apart.
+    """
+    d = Vector(p2) - p1
+    w = Vector(v2) - v1
+    r = r1 + r2
+    a = w.dot(w)
+    b = d.dot(w)
+    c = d.dot(d) - r * r
+    if c <= 0:
+        return 0.0 if b < 0 else math.inf
+    disc = b * b - a * c
+    if a == 0 or disc < 0 or b >= 0:
+        return math.inf
+    t = (-b - math.sqrt(disc)) / a
+    return t if 0 <= t <= 1 else math.inf
+
+
+def circle_rect(p: Vector, v: Vector, r: float, rect: pygame.Rect) -> Optional[Hit]:
+    """First contact of a moving circle with the outside of rect.
+
+    Returns (t, normal) with the normal pointing out of rect, or None.
+    Like circle_circle, a circle that already touches rect hits at t=0 if
+    it is closing in, and never if it is moving apart or not moving.
+    """
+    if v.length_squared() == 0:
+        return None
+    closest = Vector(
+        min(max(p.x, rect.left), rect.right), min(max(p.y, rect.top), rect.bottom)
+    )
+    offset = p - closest
+    if offset.length_squared() <= r * r:
+        if offset.length_squared() == 0 or offset.dot(v) >= 0:
+            return None
+        return 0.0, offset.normalize()
+
+    # Slab test against rect grown by r; rounded corners are checked below
+    enter, leave, normal = -math.inf, math.inf, Vector()
+    for axis, (low, high) in enumerate(
+        ((rect.left - r, rect.right + r), (rect.top - r, rect.bottom + r))
+    ):
+        if v[axis] == 0:
+            if not low <= p[axis] <= high:
+                return None
+            continue
+        near, far = (low, high) if v[axis] > 0 else (high, low)
+        t_near = (near - p[axis]) / v[axis]
+        t_far = (far - p[axis]) / v[axis]
+        if t_near > enter:
+            enter = t_near
+            normal = Vector(0, 0)
+            normal[axis] = -math.copysign(1, v[axis])
+        leave = min(leave, t_far)
+    if enter > leave or enter > 1 or leave <= 0:
+        return None
+    enter = max(enter, 0.0)
+
+    contact = p + v * enter
+    corner = Vector(
+        rect.left if contact.x < rect.left else rect.right,
+        rect.top if contact.y < rect.top else rect.bottom,
+    )
+    outside_x = not rect.left <= contact.x <= rect.right
+    outside_y = not rect.top <= contact.y <= rect.bottom
+    if outside_x and outside_y:
+        t = circle_circle(p, v, r, corner, (0, 0), 0)
+        if t > 1:
+            return None
+        normal = p + v * t - corner
+        if normal.length_squared() == 0:
+            return None
+        return t, normal.normalize()
+    return enter, normal
+
+
+def circle_inside(p: Vector, v: Vector, r: float, rect: pygame.Rect) -> Optional[Hit]:
+    """First contact of a moving circle with the inside walls of rect.
+
+    Returns (t, normal) with the normal pointing into rect, or None.
+    """
+    best: Optional[Hit] = None
+    for axis, (low, high) in enumerate(
+        ((rect.left + r, rect.right - r), (rect.top + r, rect.bottom - r))
+    ):
+        if v[axis] > 0:
+            t, wall = (high - p[axis]) / v[axis], -1
+        elif v[axis] < 0:
+            t, wall = (low - p[axis]) / v[axis], 1
+        else:
+            continue
+        t = max(t, 0.0)
+        if t <= 1 and (best is None or t < best[0]):
+            normal = Vector(0, 0)
+            normal[axis] = wall
+            best = (t, normal)
+    return best
@@ -0,0 +1,36 @@
+"""Pre-drawn circle surfaces, shared by everything of the same look.
+
+pong/circles.py is a symlink to this file.
+"""
+
+from typing import Dict, Iterable, Tuple, Union
+import pygame
+
+Color = Union[Tuple[int, int, int], str]
+
+_images: Dict[Tuple[int, Color, int], pygame.Surface] = {}
+
+
+def circle_image(radius: int, color: Color, width: int = 0) -> pygame.Surface:
+    """A 2r x 2r surface with the circle drawn once per (radius, color, width).
+
+    Callers share the returned surface, so they must not draw on it.
+    """
+    key = (radius, color, width)
+    image = _images.get(key)
+    if image is None:
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA, 32)
+        pygame.draw.circle(image, color, (radius, radius), radius, width)
+        if pygame.display.get_surface():
+            image = image.convert_alpha()
+        _images[key] = image
+    return image
+
+
+def draw_groups(
+    surface: pygame.Surface, *groups: Iterable[pygame.sprite.Sprite]
+) -> None:
+    """Draw every sprite of every group with a single fblits call."""
+    surface.fblits(
+        [(sprite.image, sprite.rect) for group in groups for sprite in group]
+    )
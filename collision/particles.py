@@ -0,0 +1,260 @@
+from typing import Tuple
+import numpy as np
+import pygame
+from broadphase import SweepAndPrune
+from circles import circle_image
+
+Color = Tuple[int, int, int]
+
+
+def times_of_impact(
+    p1: np.ndarray,
+    v1: np.ndarray,
+    r1: np.ndarray,
+    p2: np.ndarray,
+    v2: np.ndarray,
+    r2: np.ndarray,
+) -> np.ndarray:
+    """ccd.circle_circle for arrays of circle pairs, inf where nothing hits."""
+    d = p2 - p1
+    w = v2 - v1
+    r = r1 + r2
+    a = np.einsum("ij,ij->i", w, w)
+    b = np.einsum("ij,ij->i", d, w)
+    c = np.einsum("ij,ij->i", d, d) - r * r
+    disc = b * b - a * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (-b - np.sqrt(disc)) / a
+    moving = (a > 0) & (disc >= 0) & (b < 0) & (t >= 0) & (t <= 1)
+    return np.where(c <= 0, np.where(b < 0, 0.0, np.inf), np.where(moving, t, np.inf))
+
+
+class Particles:
+    """Structure-of-arrays particle system.
+
+    Particle i is pos[i], vel[i], radius[i] and mass[i]; only the first
+    count rows are live. Every step is a handful of whole-array NumPy
+    operations, whatever the particle count. Units are pixels and frames.
+    """
+
+    def __init__(
+        self,
+        container: pygame.Rect,
+        color: Color = (59, 220, 203),
+        capacity: int = 64,
+    ) -> None:
+        self.container = container
+        self.color = color
+        self.count = 0
+        self._pos = np.zeros((capacity, 2))
+        self._vel = np.zeros((capacity, 2))
+        self._radius = np.zeros(capacity)
+        self._mass = np.zeros(capacity)
+        self.broadphase = SweepAndPrune()
+
+    @property
+    def pos(self) -> np.ndarray:
+        return self._pos[: self.count]
+
+    @property
+    def vel(self) -> np.ndarray:
+        return self._vel[: self.count]
+
+    @property
+    def radius(self) -> np.ndarray:
+        return self._radius[: self.count]
+
+    @property
+    def mass(self) -> np.ndarray:
+        return self._mass[: self.count]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, count: int) -> None:
+        capacity = len(self._radius)
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity *= 2
+        for name in ("_pos", "_vel", "_radius", "_mass"):
+            old = getattr(self, name)
+            new = np.zeros((capacity, *old.shape[1:]))
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def add(
+        self,
+        pos: Tuple[float, float],
+        vel: Tuple[float, float],
+        radius: int,
+        mass: float = None,
+    ) -> int:
+        self._reserve(self.count + 1)
+        i = self.count
+        self._pos[i] = pos
+        self._vel[i] = vel
+        self._radius[i] = radius
+        # Uniform density discs unless told otherwise
+        self._mass[i] = radius**2 if mass is None else mass
+        self.count += 1
+        return i
+
+    def spawn(
+        self,
+        count: int,
+        radius: Tuple[int, int] = (2, 6),
+        speed: float = 2,
+        seed: int = None,
+    ) -> None:
+        """Add count particles at random, non-overlapping-ish positions."""
+        rng = np.random.default_rng(seed)
+        radii = rng.integers(radius[0], radius[1] + 1, count).astype(float)
+        low = np.array(self.container.topleft) + radii[:, None]
+        high = np.array(self.container.bottomright) - radii[:, None]
+        pos = rng.uniform(low, high)
+        angle = rng.uniform(0, 2 * np.pi, count)
+        vel = speed * np.column_stack((np.cos(angle), np.sin(angle)))
+
+        self._reserve(self.count + count)
+        live = slice(self.count, self.count + count)
+        self._pos[live] = pos
+        self._vel[live] = vel
+        self._radius[live] = radii
+        self._mass[live] = radii**2
+        self.count += count
+
+    def step(self, dt: float = 1) -> None:
+        move = self.vel * dt
+        # Anything moving further than its radius could tunnel through a
+        # neighbour, so sweep the whole step for contacts first
+        if (np.einsum("ij,ij->i", move, move) > self.radius**2).any():
+            self.sweep(dt)
+        else:
+            self.pos[:] += move
+        self.reflect_walls()
+        self.collide()
+
+    def sweep(self, dt: float = 1) -> None:
+        """Move every particle dt ahead, bouncing pairs at their time of impact.
+
+        Each particle takes part in at most one swept contact per step, the
+        earliest; whatever is left overlapping is resolved by collide().
+        """
+        pos, vel, radius = self.pos, self.vel, self.radius
+        move = vel * dt
+        end = pos + move
+        extent = radius[:, None]
+        i, j = self.broadphase.pairs(
+            np.minimum(pos, end) - extent, np.maximum(pos, end) + extent
+        )
+        t = times_of_impact(pos[i], move[i], radius[i], pos[j], move[j], radius[j])
+        hit = np.flatnonzero(t <= 1)
+        hit = hit[np.argsort(t[hit], kind="stable")]
+        i, j, t = i[hit], j[hit], t[hit]
+
+        # Earliest contact per particle: keep pairs where both ends are seen first
+        first = np.full(self.count, len(i))
+        np.minimum.at(first, i, np.arange(len(i)))
+        np.minimum.at(first, j, np.arange(len(i)))
+        earliest = (first[i] == np.arange(len(i))) & (first[j] == np.arange(len(i)))
+        i, j, t = i[earliest], j[earliest], t[earliest]
+
+        # Advance to the contact, bounce, then spend the rest of the step
+        # travelling with the new velocity
+        done = np.ones(self.count)
+        done[i] = done[j] = t
+        pos[:] += move * done[:, None]
+        normal = pos[j] - pos[i]
+        self._bounce(i, j, normal, np.einsum("ij,ij->i", normal, normal))
+        bounced = np.concatenate((i, j))
+        pos[bounced] += vel[bounced] * ((1 - done[bounced]) * dt)[:, None]
+
+    def reflect_walls(self) -> None:
+        pos, vel, radius = self.pos, self.vel, self.radius
+        box = self.container
+        for axis, (start, end) in enumerate(
+            ((box.left, box.right), (box.top, box.bottom))
+        ):
+            low = start + radius
+            span = np.maximum(end - radius - low, 1e-9)
+            # Unfold the path into mirrored copies of the box: every crossed
+            # wall is a reflection, however far the particle travelled
+            offset = pos[:, axis] - low
+            bounces = np.floor(offset / span)
+            folded = np.mod(offset, 2 * span)
+            pos[:, axis] = low + np.where(folded > span, 2 * span - folded, folded)
+            vel[:, axis] *= np.where(bounces % 2, -1, 1)
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Index arrays (i, j) of pairs whose bounding boxes overlap."""
+        extent = self.radius[:, None]
+        return self.broadphase.pairs(self.pos - extent, self.pos + extent)
+
+    def collide(self) -> None:
+        """Resolve overlapping, approaching pairs as elastic collisions."""
+        i, j = self.candidate_pairs()
+        if not len(i):
+            return
+        pos, radius, mass = self.pos, self.radius, self.mass
+
+        normal = pos[j] - pos[i]
+        dist2 = np.einsum("ij,ij->i", normal, normal)
+        reach = radius[i] + radius[j]
+        touching = (dist2 < reach * reach) & (dist2 > 0)
+        i, j, normal, dist2, reach = (
+            i[touching],
+            j[touching],
+            normal[touching],
+            dist2[touching],
+            reach[touching],
+        )
+        if not len(i):
+            return
+
+        # A particle touching several others is resolved one contact per
+        # round, so every impulse stays exactly elastic
+        pending = np.arange(len(i))
+        first = np.empty(self.count, dtype=int)
+        while len(pending):
+            a, b = i[pending], j[pending]
+            first.fill(len(i))
+            np.minimum.at(first, a, pending)
+            np.minimum.at(first, b, pending)
+            now = (first[a] == pending) & (first[b] == pending)
+            self._bounce(a[now], b[now], normal[pending[now]], dist2[pending[now]])
+            pending = pending[~now]
+
+        # Push the pair apart along the normal, the lighter one further
+        total = mass[i] + mass[j]
+        dist = np.sqrt(dist2)
+        push = ((reach - dist) / (dist * total))[:, None] * normal
+        np.add.at(pos, i, -mass[j][:, None] * push)
+        np.add.at(pos, j, mass[i][:, None] * push)
+        # Never leave anything pushed through a wall
+        box = self.container
+        np.clip(
+            pos,
+            np.array(box.topleft) + radius[:, None],
+            np.array(box.bottomright) - radius[:, None],
+            out=pos,
+        )
+
+    def _bounce(
+        self, i: np.ndarray, j: np.ndarray, normal: np.ndarray, dist2: np.ndarray
+    ) -> None:
+        vel, mass = self.vel, self.mass
+        total = mass[i] + mass[j]
+        closing = np.einsum("ij,ij->i", vel[i] - vel[j], normal)
+        # Pairs already separating keep their velocities
+        impulse = (np.maximum(closing, 0) * 2 / (total * dist2))[:, None] * normal
+        vel[i] -= mass[j][:, None] * impulse
+        vel[j] += mass[i][:, None] * impulse
+
+    def draw(self, surface: pygame.Surface) -> None:
+        radius = self.radius.astype(int)
+        topleft = (self.pos - radius[:, None]).astype(int).tolist()
+        radius = radius.tolist()
+        # Particles of one radius all blit the same cached surface
+        images = {r: circle_image(r, self.color) for r in set(radius)}
+        surface.fblits([(images[r], xy) for r, xy in zip(radius, topleft)])
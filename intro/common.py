@@ -2,8 +2,10 @@ from __future__ import annotations
 import sys
 import pygame
 import pymunk
-from typing import Mapping, Callable, Tuple, List, Union
+from collections import OrderedDict
+from typing import Mapping, Callable, Optional, Tuple, List, Union
 from pathlib import Path
+from profiler import Profiler
 
 Color = Union[Tuple[int, int, int], str]
 Coordinate = Tuple[int, int]
@@ -18,16 +20,22 @@ class AttrDict(dict):
 
 
 class Timer:
-    def __init__(self, clock: pygame.time.Clock, threshold: int = 2000) -> None:
+    def __init__(
+        self,
+        clock: pygame.time.Clock,
+        threshold: int = 2000,
+        time_source: Callable[[], int] = pygame.time.get_ticks,
+    ) -> None:
         self.__clock = clock
         self.__threshold = threshold
+        self.__time_source = time_source
         self.__event_time = 0
 
     def __repr__(self) -> str:
         return f"Timer(threshold={self.__threshold})"
 
     def __get_current_time(self) -> int:
-        return pygame.time.get_ticks()
+        return self.__time_source()
 
     @property
     def current_time(self) -> None:
@@ -57,6 +65,8 @@ class Asset(pygame.sprite.Sprite):
 
 
 class Masked(Asset):
+    SHADOW_CACHE_SIZE = 64
+
     def __init__(
         self,
         x: int,
@@ -68,16 +78,32 @@ class Masked(Asset):
         super().__init__(x, y, image=image, scale=scale)
         self.mask = pygame.mask.from_surface(self.image)
         self.shadowed = self.make_shadowed(self.mask, shadow_color)
+        self._shadows: OrderedDict[tuple, Optional[pygame.Surface]] = OrderedDict()
 
     def make_shadowed(self, mask: pygame.mask.Mask, shadow_color: Color):
-        shadowed = mask.to_surface()
-        shadowed.set_colorkey((0, 0, 0))
-        width, height = shadowed.get_size()
-        for x in range(width):
-            for y in range(height):
-                color = shadowed.get_at((x, y))
-                if color != (0, 0, 0, 255):
-                    shadowed.set_at((x, y), shadow_color)
+        return mask.to_surface(setcolor=shadow_color, unsetcolor=(0, 0, 0, 0))
+
+    def overlap_shadow(
+        self, other: Masked, shadow_color: Color
+    ) -> Optional[pygame.Surface]:
+        """Our pixels that overlap other, in shadow_color, or None.
+
+        Masks are fixed per sprite, so the result only depends on where
+        other is relative to us and is cached on that offset.
+        """
+        offset = (other.rect.left - self.rect.left, other.rect.top - self.rect.top)
+        key = (other, offset, shadow_color)
+        if key in self._shadows:
+            self._shadows.move_to_end(key)
+            return self._shadows[key]
+
+        shadowed = None
+        if self.mask.overlap(other.mask, offset):
+            overlap = self.mask.overlap_mask(other.mask, offset)
+            shadowed = self.make_shadowed(overlap, shadow_color)
+        self._shadows[key] = shadowed
+        if len(self._shadows) > self.SHADOW_CACHE_SIZE:
+            self._shadows.popitem(last=False)
         return shadowed
 
 
@@ -110,12 +136,66 @@ class Physical(Asset):
         super().kill()
 
 
+class RotationCache:
+    """Copies of one image rotated to steps evenly spaced angles.
+
+    A frame is rendered with rotozoom the first time its angle is asked
+    for, or all at once with fill(). With a capacity, only that many
+    frames are kept and the least recently used one is dropped first.
+    """
+
+    Frame = Tuple[pygame.Surface, Optional[pygame.mask.Mask]]
+
+    def __init__(
+        self,
+        image: pygame.Surface,
+        steps: int = 360,
+        capacity: int = None,
+        masks: bool = False,
+    ) -> None:
+        self.image = image
+        self.steps = steps
+        self.capacity = capacity
+        self.masks = masks
+        self._frames: OrderedDict[int, RotationCache.Frame] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def index(self, angle: float) -> int:
+        return round(angle * self.steps / 360) % self.steps
+
+    def _render(self, index: int) -> Frame:
+        image = pygame.transform.rotozoom(self.image, index * 360 / self.steps, 1)
+        return image, pygame.mask.from_surface(image) if self.masks else None
+
+    def get(self, angle: float) -> Frame:
+        index = self.index(angle)
+        frame = self._frames.get(index)
+        if frame is None:
+            frame = self._frames[index] = self._render(index)
+            if self.capacity and len(self._frames) > self.capacity:
+                self._frames.popitem(last=False)
+        else:
+            self._frames.move_to_end(index)
+        return frame
+
+    def fill(self) -> None:
+        """Render missing frames in angle order, up to capacity frames."""
+        for index in range(self.steps):
+            if self.capacity and len(self._frames) >= self.capacity:
+                break
+            if index not in self._frames:
+                self._frames[index] = self._render(index)
+
+
 class Rotating(Asset):
     def __init__(
         self, x: int, y: int, image: pygame.Surface, scale: Tuple[int, int] = None
     ) -> None:
         super().__init__(x, y, image=image, scale=scale)
         self.original_image = image
+        self.rotations = RotationCache(image)
         self.angle = 0
         self.direction = 1
 
@@ -126,12 +206,11 @@ class Rotating(Asset):
         self.direction = 1
 
     def update(self):
-        rotated = pygame.transform.rotozoom(
-            self.original_image, angle=self.angle, scale=1
-        )
-        self.image = rotated
-        self.rect = self.image.get_rect()
-        self.rect.center = (self._pos_x, self._pos_y)
+        rotated, _ = self.rotations.get(self.angle)
+        if rotated is not self.image:
+            self.image = rotated
+            self.rect = self.image.get_rect()
+            self.rect.center = (self._pos_x, self._pos_y)
         self.angle += self.direction * 1
 
 
@@ -230,6 +309,10 @@ class TextBox:
 
 
 class Game:
+    PROFILER_KEY = pygame.K_F3
+    TRACE_KEY = pygame.K_F4
+    TRACE_PATH = "trace.json"
+
     def __init__(
         self,
         screen_width: int,
@@ -240,6 +323,7 @@ class Game:
         caption: str = "",
     ):
         self.clock = pygame.time.Clock()
+        self.profiler = Profiler(phases=("events", "func", "flip", "tick"))
         pygame.init()
         pygame.mouse.set_visible(mouse_visible)
         self.screen = pygame.display.set_mode((screen_width, screen_height))
@@ -269,6 +353,11 @@ class Game:
         events = events or {}
         for event in pygame.event.get():
             self._process_exit(event.type)
+            if event.type == pygame.KEYDOWN:
+                if event.key == self.PROFILER_KEY:
+                    self.profiler.toggle()
+                elif event.key == self.TRACE_KEY:
+                    self.profiler.export(self.TRACE_PATH)
             if func := events.get(event.type):
                 func(event)
 
@@ -284,12 +373,19 @@ class Game:
                 self.screen.blit(image, (image_width * x, image_height * y))
 
     def _loop(self, func: Callable, events: Mapping[int, Callable] = None) -> None:
+        profiler = self.profiler
         while True:
-            if events is not None:
+            with profiler.phase("events"):
+                # Always drained, so the profiler keys work in every demo
                 self._process_events(events=events)
-            func(self)
-            pygame.display.flip()
-            self.clock.tick(60)
+            with profiler.phase("func"):
+                func(self)
+            profiler.draw(self.screen)
+            with profiler.phase("flip"):
+                pygame.display.flip()
+            with profiler.phase("tick"):
+                self.clock.tick(60)
+            profiler.end_frame()
 
     def init(self) -> None:
         pass
@@ -30,13 +30,7 @@ class Masks(Game):
             self.obstacle_group.draw(self.screen)
             self.player_group.update()
 
-            offset_x = self.obstacle.rect.topleft[0] - self.player.rect.left
-            offset_y = self.obstacle.rect.topleft[1] - self.player.rect.top
-            if self.player.mask.overlap(self.obstacle.mask, (offset_x, offset_y)):
-                overlap_mask = self.player.mask.overlap_mask(
-                    self.obstacle.mask, (offset_x, offset_y)
-                )
-                shadowed = self.player.make_shadowed(overlap_mask, "lightblue")
+            if shadowed := self.player.overlap_shadow(self.obstacle, "lightblue"):
                 self.screen.blit(shadowed, self.player.rect)
 
         #            if pygame.sprite.spritecollide(
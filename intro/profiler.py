@@ -0,0 +1 @@
+../ultimate/lib/profiler.py
\ No newline at end of file
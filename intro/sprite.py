@@ -50,16 +50,14 @@ class ShootingRange(Game):
     def set_stage(self, stage: str) -> str:
         self.stage = stage
 
-    def intro(self) -> None:
-        def _start_game(_: pygame.event.Event):
+    def click(self, _: pygame.event.Event) -> None:
+        if self.stage == "intro":
             self.player.sound.play()
             self.set_stage("main")
+        elif self.target_group is not None:
+            self.player.shoot(self.target_group)
 
-        events = {
-            pygame.MOUSEBUTTONDOWN: _start_game,
-        }
-        self._process_events(events)
-
+    def intro(self) -> None:
         self._set_background(self.images.background)
         coordinates = (
             self.screen.get_width() / 2 - self.images.ready.get_width() / 2,
@@ -87,11 +85,6 @@ class ShootingRange(Game):
                 t = Target(x, y, self.images.target)
                 self.target_group.add(t)
 
-        events = {
-            pygame.MOUSEBUTTONDOWN: lambda _: self.player.shoot(self.target_group),
-        }
-        self._process_events(events)
-
         self._set_background(self.images.background)
         self.target_group.draw(self.screen)
 
@@ -105,7 +98,7 @@ class ShootingRange(Game):
             elif self.stage == "main":
                 self.main()
 
-        self._loop(_run)
+        self._loop(_run, events={pygame.MOUSEBUTTONDOWN: self.click})
 
 
 screen_width = 800
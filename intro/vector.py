@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Union
-from common import Game, Asset, Coordinate
+from common import Game, Asset, Coordinate, RotationCache
 from enum import IntEnum
 import pygame
 
@@ -19,6 +19,10 @@ class Car(Asset):
 
         self.angle = 0
         self.rotation_speed = 1.8
+        # One frame per rotation_speed degrees, so every reachable angle is exact
+        self.rotations = RotationCache(
+            self.original_image, steps=round(360 / self.rotation_speed)
+        )
         self.direction = Car.Direction.STRAIGHT
         self.forward = pygame.math.Vector2(0, -1)
         self.active = False
@@ -46,8 +50,10 @@ class Car(Asset):
         elif self.direction == Car.Direction.LEFT:
             self.angle += self.rotation_speed
 
-        self.image = pygame.transform.rotozoom(self.original_image, self.angle, 1)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        image, _ = self.rotations.get(self.angle)
+        if image is not self.image:
+            self.image = image
+            self.rect = self.image.get_rect(center=self.rect.center)
 
     def get_rotation(self) -> None:
         if self.direction == Car.Direction.RIGHT:
@@ -0,0 +1,35 @@
+from typing import Iterable, Tuple
+import pygame
+from spatial import AnyRect
+from sprite import Sprite
+
+
+class Camera:
+    """Viewport onto the level, centered on a target and kept inside bounds."""
+
+    def __init__(self, size: Tuple[int, int], bounds: pygame.Rect) -> None:
+        self.view = pygame.FRect((0, 0), size)
+        self.bounds = bounds
+
+    @property
+    def offset(self) -> Tuple[float, float]:
+        return self.view.topleft
+
+    def follow(self, rect: AnyRect) -> None:
+        self.view.center = rect.center
+        self.view.clamp_ip(self.bounds)
+        # Whole pixels, so neighbouring chunks and sprites never drift apart
+        self.view.topleft = (round(self.view.x), round(self.view.y))
+
+    def apply(self, rect: AnyRect) -> AnyRect:
+        return rect.move(-self.view.x, -self.view.y)
+
+    def draw(
+        self, surface: pygame.Surface, sprites: Iterable[Sprite], alpha: float = 1.0
+    ):
+        surface.fblits(
+            [
+                (sprite.image, self.apply(sprite.interpolated(alpha)))
+                for sprite in sprites
+            ]
+        )
@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, List, Set, Tuple
+from weakref import WeakKeyDictionary
+import pygame
+from settings import TILE_SIZE, CHUNK_SIZE
+
+Blit = Tuple[pygame.Surface, Tuple[float, float]]
+
+_opaque: "WeakKeyDictionary[pygame.Surface, bool]" = WeakKeyDictionary()
+
+
+def is_opaque(surface: pygame.Surface) -> bool:
+    """Whether every pixel of surface has full alpha (cached per surface)."""
+    opaque = _opaque.get(surface)
+    if opaque is None:
+        width, height = surface.get_size()
+        mask = pygame.mask.from_surface(surface, threshold=254)
+        opaque = _opaque[surface] = mask.count() == width * height
+    return opaque
+
+
+def drop_hidden(blits: Iterable[Blit]) -> Tuple[List[Blit], int]:
+    """blits without those fully covered by a later opaque blit of the same rect.
+
+    Also returns the number of pixels that no longer need drawing.
+    """
+    blits = list(blits)
+    covered = {}
+    for order, (surface, pos) in enumerate(blits):
+        if is_opaque(surface):
+            covered[(*pos, *surface.get_size())] = order
+    visible, hidden = [], 0
+    for order, (surface, pos) in enumerate(blits):
+        if covered.get((*pos, *surface.get_size()), -1) > order:
+            hidden += surface.get_width() * surface.get_height()
+        else:
+            visible.append((surface, pos))
+    return visible, hidden
+
+
+class ChunkLayer:
+    """Static tiles pre-composited into chunk_size x chunk_size surfaces.
+
+    Tiles hidden under an opaque tile are skipped while baking
+    (hidden_pixels counts them), and fully opaque chunks are stored
+    without per-pixel alpha, which blits faster.
+    """
+
+    def __init__(
+        self, blits: Iterable[Blit], chunk_size: int = CHUNK_SIZE * TILE_SIZE
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.opaque: Set[Tuple[int, int]] = set()
+        self.hidden_pixels = 0
+        self.bake(blits)
+
+    def bake(self, blits: Iterable[Blit]) -> None:
+        size = self.chunk_size
+        blits, hidden = drop_hidden(blits)
+        self.hidden_pixels += hidden
+        for surface, pos in blits:
+            rect = surface.get_rect(topleft=pos)
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    chunk = self.chunks.get((cx, cy))
+                    if chunk is None:
+                        chunk = pygame.Surface((size, size), pygame.SRCALPHA)
+                        self.chunks[(cx, cy)] = chunk
+                    chunk.blit(surface, (rect.x - cx * size, rect.y - cy * size))
+
+        self.opaque = {key for key, chunk in self.chunks.items() if is_opaque(chunk)}
+        self.chunks = {
+            key: chunk.convert() if key in self.opaque else chunk.convert_alpha()
+            for key, chunk in self.chunks.items()
+        }
+
+    def _keys(self, view: pygame.Rect) -> Iterable[Tuple[int, int]]:
+        size = self.chunk_size
+        for cx in range(int(view.left // size), int((view.right - 1) // size) + 1):
+            for cy in range(int(view.top // size), int((view.bottom - 1) // size) + 1):
+                yield cx, cy
+
+    def covers(self, view: pygame.Rect) -> bool:
+        """Whether opaque chunks fill view, so nothing beneath shows through."""
+        return all(key in self.opaque for key in self._keys(view))
+
+    def visible(
+        self, view: pygame.Rect
+    ) -> Iterable[Tuple[Tuple[int, int], pygame.Surface]]:
+        size = self.chunk_size
+        for cx, cy in self._keys(view):
+            if chunk := self.chunks.get((cx, cy)):
+                yield (cx * size, cy * size), chunk
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[float, float] = (0, 0)):
+        view = surface.get_rect(topleft=offset)
+        surface.fblits(
+            [(chunk, (x - view.x, y - view.y)) for (x, y), chunk in self.visible(view)]
+        )
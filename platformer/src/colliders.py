@@ -0,0 +1,35 @@
+from typing import Iterable, List, Tuple
+import pygame
+from settings import TILE_SIZE
+
+
+def merge_tiles(
+    cells: Iterable[Tuple[int, int]], tile_size: int = TILE_SIZE
+) -> List[pygame.FRect]:
+    """Cover solid tile cells with few, large rects (greedy meshing).
+
+    Cells are claimed top to bottom, left to right: each rect grows right
+    as far as the row is solid, then down while the whole span below is
+    solid and unclaimed. Merged rects also have no inner seams for the
+    player to catch on.
+    """
+    solid = set(cells)
+    rects = []
+    for y, x in sorted((y, x) for x, y in solid):
+        if (x, y) not in solid:
+            continue  # claimed by an earlier rect
+        width = 1
+        while (x + width, y) in solid:
+            width += 1
+        height = 1
+        while all((x + dx, y + height) in solid for dx in range(width)):
+            height += 1
+        for dy in range(height):
+            for dx in range(width):
+                solid.discard((x + dx, y + dy))
+        rects.append(
+            pygame.FRect(
+                x * tile_size, y * tile_size, width * tile_size, height * tile_size
+            )
+        )
+    return rects
@@ -1,24 +1,27 @@
 import pygame
 import sys
-from typing import Dict
 from settings import SCREEN_HEIGHT, SCREEN_WIDHT
 from level import Level
-from pytmx.util_pygame import load_pygame
-from pytmx import TiledMap
+from registry import LevelRegistry
+from loop import FixedStep
 from pathlib import Path
 
 
 class Game:
     FRAME_RATE: int = 120
+    TICK_RATE: int = 120
+    LEVELS_DIR: Path = Path("../data/levels")
+    CACHE_DIR: Path = Path("../data/cache")
 
     def __init__(self) -> None:
         pygame.init()
         self.display = pygame.display.set_mode((SCREEN_WIDHT, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
+        self.timestep = FixedStep(self.TICK_RATE)
         pygame.display.set_caption("Super Pirate World")
 
-        self.tmx_maps = self.load_tmx_maps()
-        self.current_stage = Level(self.tmx_maps["omni"])
+        self.levels = LevelRegistry(self.LEVELS_DIR, self.CACHE_DIR)
+        self.load_stage("omni")
 
     def process_events(self):
         for event in pygame.event.get():
@@ -26,22 +29,21 @@ class Game:
                 self.quit()
 
     def quit(self) -> None:
+        self.levels.close()
         pygame.quit()
         sys.exit()
 
-    def load_tmx_maps(self) -> Dict[str, TiledMap]:
-        tmx_dir = Path("../data/levels")
-        return {
-            ppath.name[:-4]: load_pygame(ppath)
-            for ppath in tmx_dir.iterdir()
-            if ppath.name.endswith(".tmx")
-        }
+    def load_stage(self, name: str) -> None:
+        self.current_stage = Level(self.levels.get(name))
+        self.levels.prefetch(self.levels.next(name))
 
     def run(self) -> None:
         while True:
             dt = self.clock.tick(self.FRAME_RATE) / 1000
             self.process_events()
 
-            self.current_stage.draw(self.display, dt)
+            for _ in range(self.timestep.advance(dt)):
+                self.current_stage.update(self.timestep.step)
+            self.current_stage.draw(self.display, self.timestep.alpha)
 
             pygame.display.update()
@@ -1,41 +1,93 @@
+import logging
 import pygame
-from settings import TILE_SIZE
+from typing import Iterable
+from settings import TILE_SIZE, Layers
 from sprite import Sprite
 from player import Player
-from pytmx import TiledMap
+from chunks import Blit
+from spatial import SpatialHash
+from render import RenderGraph
+from camera import Camera
+from colliders import merge_tiles
+from levels import CompiledLevel
+from timer import Scheduler
+from util import SimulationTime
+
+log = logging.getLogger(__name__)
 
 
 class Level:
-    def __init__(self, map: TiledMap) -> None:
+    TILE_LAYERS = {
+        "BG": Layers.BG_TILES,
+        "Terrain": Layers.MAIN,
+        "Platforms": Layers.MAIN,
+        "FG": Layers.FG,
+    }
+
+    def __init__(self, map: CompiledLevel) -> None:
         self.diplay = pygame.display.get_surface()
 
-        self.sprites = pygame.sprite.Group()
-        self.collision_sprites = pygame.sprite.Group()
         self.player = pygame.sprite.GroupSingle()
+        self.render = RenderGraph()
+
+        self.time = SimulationTime()
+        self.scheduler = Scheduler(self.time.now)
 
         self.setup(map)
 
-    def setup(self, map: TiledMap) -> None:
-        for x, y, surface in map.get_layer_by_name("Terrain").tiles():
-            s = Sprite(
-                (x * TILE_SIZE, y * TILE_SIZE),
-                surface,
-                self.sprites,
-                self.collision_sprites,
-            )
-            self.sprites.add(s)
+    @property
+    def hidden_pixels(self) -> int:
+        """Tile pixels the occlusion pass kept out of the baked layers."""
+        return self.render.hidden_pixels
+
+    def layer_tiles(self, map: CompiledLevel, name: str) -> Iterable[Blit]:
+        for x, y, surface in map.get_layer_by_name(name).tiles():
+            yield surface, (x * TILE_SIZE, y * TILE_SIZE)
+
+    def setup(self, map: CompiledLevel) -> None:
+        self.camera = Camera(
+            self.diplay.get_size(),
+            pygame.Rect(0, 0, map.width * map.tilewidth, map.height * map.tileheight),
+        )
+        for name, layer in self.TILE_LAYERS.items():
+            self.render.add_tiles(layer, self.layer_tiles(map, name))
+
+        self.colliders = merge_tiles(
+            (x, y) for x, y, _ in map.get_layer_by_name("Terrain").tiles()
+        )
+        self.collision_index = SpatialHash(self.colliders)
 
         for obj in map.get_layer_by_name("Objects"):
             if obj.name == "player":
-                Player(
+                player = Player(
                     (obj.x, obj.y),
                     obj.image,
-                    self.collision_sprites,
-                    self.sprites,
+                    self.collision_index,
+                    self.scheduler,
                     self.player,
                 )
+                self.render.add(player)
+            elif obj.image:
+                sprite = Sprite((obj.x, obj.y), obj.image)
+                self.render.add(sprite, static=True)
+        self.render.bake()
+        log.info(
+            "%s: occlusion pass skipped %d hidden tile pixels",
+            map.path.stem,
+            self.render.hidden_pixels,
+        )
 
-    def draw(self, surface: pygame.Surface, dt: float) -> None:
-        surface.fill("black")
-        self.sprites.draw(surface)
+    def update(self, dt: float) -> None:
+        self.time.advance(dt * 1000)
+        self.scheduler.tick()
         self.player.update(dt)
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Draw the level alpha of the way from the previous tick to the last."""
+        camera = self.camera
+        camera.follow(self.player.sprite.interpolated(alpha))
+
+        if not self.render.covers(camera.view):
+            surface.fill("black")
+        self.render.draw(surface, camera, alpha)
+        self.player.sprite.draw_contacts(surface, camera.offset)
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+import pygame
+
+MAGIC = b"PLVL"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")  # magic, version, metadata length
+ATLAS_WIDTH = 1024
+
+Frame = Tuple[int, int, int, int]
+
+
+class TileLayer:
+    def __init__(
+        self, name: str, data: memoryview, width: int, frames: List[pygame.Surface]
+    ) -> None:
+        self.name = name
+        self.data = data
+        self.width = width
+        self.frames = frames
+
+    def tiles(self) -> Iterator[Tuple[int, int, pygame.Surface]]:
+        for idx, frame in enumerate(self.data):
+            if frame:
+                yield idx % self.width, idx // self.width, self.frames[frame - 1]
+
+
+class MapObject:
+    def __init__(
+        self,
+        name: str,
+        type: Optional[str],
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        image: Optional[pygame.Surface],
+        properties: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.type = type
+        self.x, self.y = x, y
+        self.width, self.height = width, height
+        self.image = image
+        self.properties = properties
+
+
+class ObjectLayer(list):
+    def __init__(self, name: str, objects: List[MapObject]) -> None:
+        super().__init__(objects)
+        self.name = name
+
+
+class CompiledLevel:
+    """Memory-mapped level produced by compile_level.
+
+    Mirrors the parts of pytmx.TiledMap used by Level. Opening only maps the
+    file, so it is safe on a worker thread; build() creates the surfaces
+    and must run on the main thread before the level is used.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.meta, self._data = _read(self._mmap)
+
+        self.width, self.height = self.meta["width"], self.meta["height"]
+        self.tilewidth = self.tileheight = self.meta["tile_size"]
+        self.layers: Optional[List[Any]] = None
+
+    def build(self) -> "CompiledLevel":
+        """Create the atlas and layers; surfaces need the main thread."""
+        if self.layers is not None:
+            return self
+        data = self._data
+        atlas_meta = self.meta["atlas"]
+        start = atlas_meta["offset"]
+        end = start + atlas_meta["size"][0] * atlas_meta["size"][1] * 4
+        self.atlas = pygame.image.frombuffer(
+            data[start:end], atlas_meta["size"], "RGBA"
+        ).convert_alpha()
+        self.frames = [self.atlas.subsurface(frame) for frame in atlas_meta["frames"]]
+
+        layers = []
+        for layer in self.meta["layers"]:
+            if layer["type"] == "tiles":
+                start = layer["offset"]
+                end = start + self.width * self.height * 2
+                layers.append(
+                    TileLayer(
+                        layer["name"],
+                        data[start:end].cast("H"),
+                        self.width,
+                        self.frames,
+                    )
+                )
+            else:
+                objects = [
+                    MapObject(
+                        obj["name"],
+                        obj["type"],
+                        obj["x"],
+                        obj["y"],
+                        obj["width"],
+                        obj["height"],
+                        self.frames[obj["frame"]] if obj["frame"] is not None else None,
+                        obj["properties"],
+                    )
+                    for obj in layer["objects"]
+                ]
+                layers.append(ObjectLayer(layer["name"], objects))
+        self.layers = layers
+        return self
+
+    def get_layer_by_name(self, name: str):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise ValueError(f"Layer {name} not found")
+
+
+class _AtlasBuilder:
+    def __init__(self) -> None:
+        self.frames: List[Frame] = []
+        self.surfaces: List[pygame.Surface] = []
+        self._index: Dict[Tuple[Tuple[int, int], bytes], int] = {}
+
+    def add(self, surface: pygame.Surface) -> int:
+        key = (surface.get_size(), pygame.image.tobytes(surface, "RGBA"))
+        if key not in self._index:
+            self._index[key] = len(self.surfaces)
+            self.surfaces.append(surface)
+        return self._index[key]
+
+    def build(self) -> pygame.Surface:
+        # Shelf packing, tallest frames first
+        order = sorted(
+            range(len(self.surfaces)), key=lambda i: -self.surfaces[i].get_height()
+        )
+        width = max([ATLAS_WIDTH, *(s.get_width() for s in self.surfaces)])
+        self.frames = [(0, 0, 0, 0)] * len(self.surfaces)
+        x = y = shelf_height = 0
+        for idx in order:
+            w, h = self.surfaces[idx].get_size()
+            if x + w > width:
+                x, y, shelf_height = 0, y + shelf_height, 0
+            self.frames[idx] = (x, y, w, h)
+            x += w
+            shelf_height = max(shelf_height, h)
+
+        atlas = pygame.Surface((width, max(1, y + shelf_height)), pygame.SRCALPHA)
+        for surface, frame in zip(self.surfaces, self.frames):
+            atlas.blit(surface, frame[:2])
+        return atlas
+
+
+def _read(mm: mmap.mmap) -> Tuple[Dict[str, Any], memoryview]:
+    magic, version, length = HEADER.unpack_from(mm)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Unsupported level cache format")
+    meta = json.loads(mm[HEADER.size : HEADER.size + length])
+    return meta, memoryview(mm)[_align(HEADER.size + length) :]
+
+
+def _align(offset: int, to: int = 4) -> int:
+    return (offset + to - 1) // to * to
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _dependencies(source: Path) -> List[Path]:
+    found, pending = [], [source]
+    while pending:
+        path = pending.pop()
+        found.append(path)
+        for node in ElementTree.parse(path).getroot().iter():
+            if node.tag in ("tileset", "image") and "source" in node.attrib:
+                dep = (path.parent / node.attrib["source"]).resolve()
+                if dep not in found and dep not in pending:
+                    if dep.suffix == ".tsx":
+                        pending.append(dep)
+                    else:
+                        found.append(dep)
+    return found
+
+
+def _properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) else str(value)
+        for key, value in properties.items()
+    }
+
+
+def _image_loader(filename: str, colorkey: Optional[str], **kwargs):
+    """pytmx image loader that leaves surfaces unconverted.
+
+    Unlike pytmx.util_pygame's loader it never calls convert(), so
+    compile_level can run off the main thread.
+    """
+    from pytmx.util_pygame import handle_transformation
+
+    image = pygame.image.load(filename)
+
+    def load(rect=None, flags=None) -> pygame.Surface:
+        tile = image.subsurface(rect) if rect else image.copy()
+        if flags:
+            tile = handle_transformation(tile, flags)
+        if colorkey:
+            keyed = pygame.Surface(tile.get_size(), pygame.SRCALPHA)
+            tile.set_colorkey(pygame.Color(f"#{colorkey}"))
+            keyed.blit(tile, (0, 0))
+            tile = keyed
+        return tile
+
+    return load
+
+
+def compile_level(source: Path, target: Path) -> None:
+    # pytmx is only needed when the cache is missing or stale
+    from pytmx import TiledMap, TiledObjectGroup, TiledTileLayer
+
+    tmx = TiledMap(str(source), image_loader=_image_loader)
+    atlas = _AtlasBuilder()
+    blobs: List[bytes] = []
+    offset = 0
+
+    layers = []
+    for layer in tmx.layers:
+        if isinstance(layer, TiledTileLayer):
+            data = array("H", bytes(2 * tmx.width * tmx.height))
+            for x, y, gid in layer.iter_data():
+                if gid and (image := tmx.images[gid]) is not None:
+                    data[y * tmx.width + x] = atlas.add(image) + 1
+            layers.append({"name": layer.name, "type": "tiles", "offset": offset})
+            blobs.append(data.tobytes())
+            offset += len(blobs[-1])
+        elif isinstance(layer, TiledObjectGroup):
+            objects = [
+                {
+                    "name": obj.name,
+                    "type": obj.type,
+                    "x": obj.x,
+                    "y": obj.y,
+                    "width": obj.width,
+                    "height": obj.height,
+                    "frame": atlas.add(obj.image) if obj.image else None,
+                    "properties": _properties(obj.properties),
+                }
+                for obj in layer
+            ]
+            layers.append({"name": layer.name, "type": "objects", "objects": objects})
+
+    atlas_surface = atlas.build()
+    blobs.append(pygame.image.tobytes(atlas_surface, "RGBA"))
+
+    meta = {
+        "byteorder": sys.byteorder,
+        "sources": {
+            str(path): [path.stat().st_mtime_ns, _digest(path)]
+            for path in _dependencies(source.resolve())
+        },
+        "width": tmx.width,
+        "height": tmx.height,
+        "tile_size": tmx.tilewidth,
+        "layers": layers,
+        "atlas": {
+            "offset": offset,
+            "size": atlas_surface.get_size(),
+            "frames": atlas.frames,
+        },
+    }
+    _write(target, meta, blobs)
+
+
+def _write(target: Path, meta: Dict[str, Any], blobs: List[bytes]) -> None:
+    encoded = json.dumps(meta).encode()
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        f.write(encoded)
+        f.write(bytes(_align(HEADER.size + len(encoded)) - HEADER.size - len(encoded)))
+        for blob in blobs:
+            f.write(blob)
+    tmp.replace(target)
+
+
+def is_fresh(target: Path) -> bool:
+    try:
+        with open(target, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            meta, data = _read(mm)
+            with data:
+                return _check_sources(target, meta, data)
+    except (OSError, ValueError):
+        return False
+
+
+def _check_sources(target: Path, meta: Dict[str, Any], data: memoryview) -> bool:
+    if meta["byteorder"] != sys.byteorder:
+        return False
+    touched = False
+    for name, source in meta["sources"].items():
+        path = Path(name)
+        if not path.exists():
+            return False
+        mtime = path.stat().st_mtime_ns
+        if mtime != source[0]:
+            # A touched but unchanged file keeps the cache valid
+            if _digest(path) != source[1]:
+                return False
+            source[0] = mtime
+            touched = True
+    if touched:
+        # Store the new mtimes so later launches skip hashing again
+        try:
+            _write(target, meta, [data])
+        except OSError:
+            pass
+    return True
+
+
+def load_level(source: Path, cache_dir: Path) -> CompiledLevel:
+    target = cache_dir / f"{source.stem}.lvl"
+    if not is_fresh(target):
+        compile_level(source, target)
+    return CompiledLevel(target)
@@ -0,0 +1 @@
+../../ultimate/lib/loop.py
\ No newline at end of file
@@ -1,7 +1,9 @@
+import logging
 from game import Game
 
 
 def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
     game = Game()
     game.run()
 
@@ -4,7 +4,8 @@ from pygame.sprite import Group
 from pygame.math import Vector2 as vector
 from sprite import Sprite
 from enum import IntEnum
-from util import Timer
+from timer import Scheduler, Timer
+from spatial import SpatialHash
 
 
 class Axis:
@@ -17,7 +18,8 @@ class Player(Sprite):
         self,
         pos: Tuple[int, int],
         surface: pygame.Surface,
-        collision_sprites: pygame.sprite.Group,
+        collision_index: SpatialHash,
+        scheduler: Scheduler,
         *groups: Group
     ) -> None:
         super().__init__(
@@ -30,13 +32,13 @@ class Player(Sprite):
         self.jump = False
         self.jump_height = 800
         self.on_surface = {"floor": False, "left": False, "right": False}
+        self.contact_rects = []
 
-        self.collision_sprites = collision_sprites
-        self.collision_rects = [sprite.rect for sprite in self.collision_sprites]
+        self.collision_index = collision_index
 
         self.timer: Dict[str, Timer] = {
-            "in_wall_jump": Timer(400),
-            "in_jump": Timer(120),
+            "in_wall_jump": Timer(400, scheduler),
+            "in_jump": Timer(120, scheduler),
         }
 
     def input(self) -> None:
@@ -99,20 +101,22 @@ class Player(Sprite):
             (self.rect.topright + vector(0, self.rect.height / 4)),
             (2, self.rect.height / 2),
         )
+        self.contact_rects = [bottom_r, left_r, right_r]
 
-        srf = pygame.display.get_surface()
-        pygame.draw.rect(srf, "yellow", bottom_r)
-        pygame.draw.rect(srf, "yellow", left_r)
-        pygame.draw.rect(srf, "yellow", right_r)
+        self.on_surface["floor"] = self.collision_index.collides(bottom_r)
+        self.on_surface["right"] = self.collision_index.collides(right_r)
+        self.on_surface["left"] = self.collision_index.collides(left_r)
 
-        self.on_surface["floor"] = bottom_r.collidelist(self.collision_rects) >= 0
-        self.on_surface["right"] = right_r.collidelist(self.collision_rects) >= 0
-        self.on_surface["left"] = left_r.collidelist(self.collision_rects) >= 0
+    def draw_contacts(
+        self, surface: pygame.Surface, offset: Tuple[float, float] = (0, 0)
+    ) -> None:
+        for rect in self.contact_rects:
+            pygame.draw.rect(surface, "yellow", rect.move(-offset[0], -offset[1]))
 
     def collision(self, axis: Axis):
-        idx = self.rect.collidelist(self.collision_rects)
-        if idx >= 0:
-            rect = self.collision_rects[idx]
+        for rect in self.collision_index.query(self.rect):
+            if not self.rect.colliderect(rect):
+                continue  # already pushed out by a previous contact
             if axis == Axis.Horizontal:
                 if self.rect.left <= rect.right and self.direction.x < 0:
                     self.rect.left = rect.right
@@ -126,11 +130,8 @@ class Player(Sprite):
                     self.direction.y = 0
                 self.direction.y = 0  # Check if we need to move it out of else
 
-    def update_timers(self) -> None:
-        [timer.update() for timer in self.timer.values()]
-
     def update(self, dt: float) -> None:
-        self.update_timers()
+        self.old_rect = self.rect.copy()
         self.check_surface_contact()
 
         self.input()
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from levels import CompiledLevel, load_level
+
+
+def _level_order(name: str):
+    return (not name.isdigit(), int(name) if name.isdigit() else name)
+
+
+class LevelRegistry:
+    """Loads levels on demand, keeping the most recently used ones around.
+
+    prefetch() compiles and maps a level on a worker thread ahead of time.
+    """
+
+    def __init__(self, levels_dir: Path, cache_dir: Path, capacity: int = 3) -> None:
+        self.levels_dir = levels_dir
+        self.cache_dir = cache_dir
+        self.capacity = capacity
+        self.names: List[str] = sorted(
+            (path.stem for path in levels_dir.glob("*.tmx")), key=_level_order
+        )
+
+        self._loaded: OrderedDict[str, CompiledLevel] = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _load(self, name: str) -> CompiledLevel:
+        try:
+            level = load_level(self.levels_dir / f"{name}.tmx", self.cache_dir)
+        except BaseException:
+            # A failed prefetch must not keep answering get() with its error
+            with self._lock:
+                self._pending.pop(name, None)
+            raise
+        with self._lock:
+            self._loaded[name] = level
+            self._loaded.move_to_end(name)
+            while len(self._loaded) > self.capacity:
+                self._loaded.popitem(last=False)
+            self._pending.pop(name, None)
+        return level
+
+    def get(self, name: str) -> CompiledLevel:
+        """The level, built on the calling thread, which must be the main one."""
+        with self._lock:
+            level = self._loaded.get(name)
+            if level is not None:
+                self._loaded.move_to_end(name)
+            future = self._pending.get(name)
+        if level is None:
+            level = future.result() if future else self._load(name)
+        # The worker only compiles and maps the file; surfaces are made here
+        return level.build()
+
+    def next(self, name: str) -> Optional[str]:
+        idx = self.names.index(name) + 1
+        return self.names[idx] if idx < len(self.names) else None
+
+    def prefetch(self, name: Optional[str]) -> None:
+        if name is None:
+            return
+        with self._lock:
+            if name in self._loaded or name in self._pending:
+                return
+            self._pending[name] = self._executor.submit(self._load, name)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,74 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Union
+import pygame
+from settings import Layers
+from chunks import Blit, ChunkLayer
+from camera import Camera
+
+Pass = Union[ChunkLayer, pygame.sprite.Group]
+
+
+class RenderGraph:
+    """Tiles and sprites bucketed by Layers and drawn back to front.
+
+    Static buckets are baked once: every run of consecutive static buckets
+    becomes a single ChunkLayer. Only the buckets of dynamic_layers are
+    walked per frame, static part of the layer first, then its sprites in
+    the order they were added. The z-order is fixed when baking, so drawing
+    never sorts.
+    """
+
+    def __init__(self, dynamic_layers: Sequence[Layers] = (Layers.MAIN,)) -> None:
+        self.dynamic_layers = frozenset(dynamic_layers)
+        self.static: Dict[Layers, List[Blit]] = defaultdict(list)
+        self.dynamic: Dict[Layers, pygame.sprite.Group] = {
+            layer: pygame.sprite.Group() for layer in self.dynamic_layers
+        }
+        self.passes: List[Pass] = []
+
+    def add_tiles(self, layer: Layers, blits: Iterable[Blit]) -> None:
+        self.static[layer].extend(blits)
+
+    def add(self, sprite: pygame.sprite.Sprite, static: bool = False) -> None:
+        if static:
+            self.static[sprite.z].append((sprite.image, sprite.rect.topleft))
+        elif sprite.z in self.dynamic:
+            self.dynamic[sprite.z].add(sprite)
+        else:
+            raise ValueError(f"{sprite.z.name} is not a dynamic layer")
+
+    def bake(self) -> None:
+        self.passes = []
+        blits: List[Blit] = []
+        for layer in Layers:
+            blits += self.static.pop(layer, ())
+            if layer in self.dynamic:
+                self._bake_run(blits)
+                self.passes.append(self.dynamic[layer])
+                blits = []
+        self._bake_run(blits)
+
+    def _bake_run(self, blits: List[Blit]) -> None:
+        if blits:
+            self.passes.append(ChunkLayer(blits))
+
+    @property
+    def hidden_pixels(self) -> int:
+        return sum(
+            stage.hidden_pixels
+            for stage in self.passes
+            if isinstance(stage, ChunkLayer)
+        )
+
+    def covers(self, view: pygame.Rect) -> bool:
+        """Whether the bottom pass alone hides whatever was on screen."""
+        return bool(self.passes) and (
+            isinstance(self.passes[0], ChunkLayer) and self.passes[0].covers(view)
+        )
+
+    def draw(self, surface: pygame.Surface, camera: Camera, alpha: float = 1.0) -> None:
+        for stage in self.passes:
+            if isinstance(stage, ChunkLayer):
+                stage.draw(surface, camera.offset)
+            else:
+                camera.draw(surface, stage, alpha)
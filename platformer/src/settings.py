@@ -5,6 +5,7 @@ SCREEN_WIDHT: int = 1280
 SCREEN_HEIGHT: int = 720
 TILE_SIZE: int = 64
 ANIMATION_SPEED: int = 6
+CHUNK_SIZE: int = 16  # in tiles
 
 
 class Layers(IntEnum):
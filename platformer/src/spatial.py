@@ -0,0 +1,45 @@
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+import pygame
+from settings import TILE_SIZE
+
+AnyRect = Union[pygame.Rect, pygame.FRect]
+
+
+class SpatialHash:
+    """Uniform grid of rects bucketed by the cells they overlap."""
+
+    def __init__(self, rects: Iterable[AnyRect] = (), cell_size: int = TILE_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[AnyRect]] = defaultdict(list)
+        for rect in rects:
+            self.insert(rect)
+
+    def _cells(self, rect: AnyRect) -> Iterator[Tuple[int, int]]:
+        size = self.cell_size
+        left, top = math.floor(rect.left / size), math.floor(rect.top / size)
+        right = max(left + 1, math.ceil(rect.right / size))
+        bottom = max(top + 1, math.ceil(rect.bottom / size))
+        for x in range(left, right):
+            for y in range(top, bottom):
+                yield x, y
+
+    def insert(self, rect: AnyRect) -> None:
+        for cell in self._cells(rect):
+            self.cells[cell].append(rect)
+
+    def query(self, rect: AnyRect) -> List[AnyRect]:
+        found = {}
+        for cell in self._cells(rect):
+            for other in self.cells.get(cell, ()):
+                if id(other) not in found and rect.colliderect(other):
+                    found[id(other)] = other
+        return list(found.values())
+
+    def collides(self, rect: AnyRect) -> bool:
+        return any(
+            rect.colliderect(other)
+            for cell in self._cells(rect)
+            for other in self.cells.get(cell, ())
+        )
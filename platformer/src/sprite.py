@@ -1,7 +1,22 @@
 from typing import Tuple
-from settings import TILE_SIZE
+from weakref import WeakKeyDictionary
+from settings import TILE_SIZE, Layers
 import pygame
 
+_interned: "WeakKeyDictionary[pygame.Surface, pygame.Surface]" = WeakKeyDictionary()
+
+
+def intern_surface(surface: pygame.Surface) -> pygame.Surface:
+    """surface.convert_alpha(), made once per source surface and shared.
+
+    Level tiles are subsurfaces of one atlas, one per unique tile, so every
+    placement of a tile converts and stores it only once.
+    """
+    image = _interned.get(surface)
+    if image is None:
+        image = _interned[surface] = surface.convert_alpha()
+    return image
+
 
 class Sprite(pygame.sprite.Sprite):
     def __init__(
@@ -9,9 +24,19 @@ class Sprite(pygame.sprite.Sprite):
         pos: Tuple[int, int],
         surface: pygame.Surface,
         *groups: pygame.sprite.Group,
-        size: Tuple[int, int] = (TILE_SIZE, TILE_SIZE)
+        size: Tuple[int, int] = (TILE_SIZE, TILE_SIZE),
+        z: Layers = Layers.MAIN,
     ) -> None:
         super().__init__(*groups)
+        self.z = z
 
-        self.image = surface.convert_alpha()
+        self.image = intern_surface(surface)
         self.rect = self.image.get_frect(topleft=pos)
+        self.old_rect = self.rect.copy()
+
+    def interpolated(self, alpha: float) -> pygame.FRect:
+        """rect alpha of the way from the previous tick's position."""
+        return self.rect.move(
+            (self.old_rect.x - self.rect.x) * (1 - alpha),
+            (self.old_rect.y - self.rect.y) * (1 - alpha),
+        )
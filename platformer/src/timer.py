@@ -0,0 +1 @@
+../../ultimate/lib/timer.py
\ No newline at end of file
@@ -0,0 +1 @@
+../collision/ccd.py
\ No newline at end of file
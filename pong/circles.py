@@ -0,0 +1 @@
+../collision/circles.py
\ No newline at end of file
@@ -1,5 +1,7 @@
 import sys
 import pygame
+from ccd import Vector, circle_inside, circle_rect
+from circles import circle_image, draw_groups
 
 pygame.init()
 clock = pygame.time.Clock()
@@ -45,30 +47,54 @@ class Pad(pygame.sprite.Sprite):
 
 
 class Ball(pygame.sprite.Sprite):
-    def __init__(self, radius, center, speed=3):
+    MAX_BOUNCES = 4
+
+    def __init__(self, radius, center, speed=3, bounds=None):
         super(Ball, self).__init__()
         self.radius = radius
         self.speed = speed
         self.served = False
-        self.vec = (0, 0)
-
-        self.image = pygame.Surface(
-            (2 * self.radius, 2 * self.radius), pygame.SRCALPHA, 32
-        )
-        self.circle = pygame.draw.circle(
-            self.image, (255, 255, 255), (self.radius, self.radius), radius, width=1
-        )
+        self.vec = Vector(0, 0)
+        self.pos = Vector(center)
+        # The bottom is left open: a missed ball drops out and is served again
+        self.bounds = bounds or pygame.Rect(0, 0, screen_width, screen_height * 2)
+
+        self.image = circle_image(radius, (255, 255, 255), width=1)
         self.rect = self.image.get_rect(center=center)
 
     def serve(self, vector):
         self.served = True
-        self.vec = vector
+        self.vec = Vector(vector) * self.speed
+
+    def move(self, obstacles):
+        """Advance one frame, bouncing at the exact time of each impact."""
+        left = 1.0
+        for _ in range(self.MAX_BOUNCES):
+            step = self.vec * left
+            if not left:
+                break
+            hits = [circle_inside(self.pos, step, self.radius, self.bounds)]
+            hits += [circle_rect(self.pos, step, self.radius, r) for r in obstacles]
+            hits = [hit for hit in hits if hit]
+            if not hits:
+                break
+            t, normal = min(hits, key=lambda hit: hit[0])
+            self.pos += step * t
+            self.vec = self.vec.reflect(normal)
+            left *= 1 - t
+        else:
+            step = Vector(0, 0)
+        self.pos += step
 
     def update(self, player):
+        if self.served:
+            self.move([player.rect])
+            if self.pos.y - self.radius > screen_height:
+                self.served = False
+                self.vec = Vector(0, 0)
         if not self.served:
-            self.rect.midbottom = player.rect.midtop
-        self.rect.x += self.vec[0]
-        self.rect.y += self.vec[1]
+            self.pos = Vector(player.rect.midtop) - (0, self.radius)
+        self.rect.center = self.pos
 
 
 radius = 10
@@ -90,8 +116,7 @@ while True:
             sys.exit()
 
     screen.fill((0, 0, 0))
-    player.draw(screen)
-    ball.draw(screen)
+    draw_groups(screen, player, ball)
 
     player.update()
     ball.update(player.sprite)
@@ -1,6 +1,7 @@
 import pygame
 from typing import Tuple, Dict, Collection
 from .types import Color
+from .mask import get_mask
 
 
 class Static(pygame.sprite.Sprite):
@@ -13,10 +14,11 @@ class Static(pygame.sprite.Sprite):
     def _load_state(self, state: str) -> None:
         self._state = state
         self.image = self._images[state]
-        topleft = self.rect.topleft if self.rect else (0, 0)
-        self.rect = self.image.get_rect()
-        self.rect.topleft = topleft
-        self.mask = pygame.mask.from_surface(self.image)
+        if self.rect:
+            self.rect.size = self.image.get_size()
+        else:
+            self.rect = self.image.get_rect()
+        self.mask = get_mask(self.image)
 
     def set_state(self, state: str) -> None:
         self._load_state(state)
@@ -37,7 +39,7 @@ class Animated(pygame.sprite.Sprite):
     def _reload_asset(self) -> None:
         self.image = self._animations[self._current_animation][0][self._current_frame]
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = get_mask(self.image)
 
     def _load_animation(self, animation: str, start_frame: int) -> None:
         self._current_animation = animation
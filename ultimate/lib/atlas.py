@@ -0,0 +1,50 @@
+import pygame
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+from .types import Color, Coordinate
+from .mask import get_mask
+
+
+class Atlas:
+    def __init__(
+        self,
+        sheet: pygame.Surface,
+        size: Coordinate,
+        start_at: Coordinate = None,
+        margin: Coordinate = None,
+        color: Color = None,
+        precompute_masks: bool = False,
+    ) -> None:
+        self.sheet = sheet
+        self.size = size
+        self.start_at = start_at or (0, 0)
+        self.margin = margin or (0, 0)
+        self.color = color
+        self.precompute_masks = precompute_masks
+        self._frames: Dict[Tuple[Coordinate, Optional[Coordinate]], pygame.Surface] = {}
+
+    def _slice(self, frame: Coordinate) -> pygame.Surface:
+        image = pygame.Surface(self.size).convert_alpha()
+        x = self.start_at[0] + (self.size[0] + self.margin[0]) * frame[0]
+        y = self.start_at[1] + (self.size[1] + self.margin[1]) * frame[1]
+        image.blit(self.sheet, (0, 0), (x, y, *self.size))
+        image.set_colorkey(self.color)
+        return image.convert_alpha()
+
+    def get(self, frame: Coordinate, scale: Coordinate = None) -> pygame.Surface:
+        key = (frame, scale)
+        if key not in self._frames:
+            image = self._slice(frame)
+            if scale:
+                image = pygame.transform.scale(image, scale)
+            if self.precompute_masks:
+                get_mask(image)
+            self._frames[key] = image
+        return self._frames[key]
+
+    def frames(
+        self, frames: Mapping[str, Coordinate], scale: Coordinate = None
+    ) -> Mapping[str, pygame.Surface]:
+        return MappingProxyType(
+            {key: self.get(frame, scale) for key, frame in frames.items()}
+        )
@@ -0,0 +1,42 @@
+import pygame
+
+
+class RealTime:
+    """Wall-clock milliseconds since pygame.init()."""
+
+    def now(self) -> int:
+        return pygame.time.get_ticks()
+
+    def frame(self) -> None:
+        pass
+
+
+class FixedStepTime:
+    """Advances by exactly step ms per frame, however long the frame took.
+
+    Run uncapped, this fast-forwards the game as quickly as the CPU
+    allows while every frame still sees the same amount of game time.
+    """
+
+    def __init__(self, step: float = 1000 / 60) -> None:
+        self.step = step
+        self._now = 0.0
+
+    def now(self) -> int:
+        return int(self._now)
+
+    def frame(self) -> None:
+        self._now += self.step
+
+
+class AcceleratedTime:
+    """Wall-clock time scaled by factor."""
+
+    def __init__(self, factor: float) -> None:
+        self.factor = factor
+
+    def now(self) -> int:
+        return int(pygame.time.get_ticks() * self.factor)
+
+    def frame(self) -> None:
+        pass
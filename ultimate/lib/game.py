@@ -2,9 +2,19 @@ import sys
 import pygame
 from typing import Mapping, Callable, Tuple
 from .types import AttrDict, Coordinate, Color
+from .render import Renderer, DirtyRenderer
+from .loop import FixedStep
+from .profiler import Profiler
+from .replay import LiveInput, InputRecorder, InputReplay
+from .clock import RealTime
+from .timer import Scheduler
 
 
 class Game:
+    PROFILER_KEY = pygame.K_F3
+    TRACE_KEY = pygame.K_F4
+    TRACE_PATH = "trace.json"
+
     def __init__(
         self,
         screen_width: int,
@@ -14,12 +24,30 @@ class Game:
         mouse_visible: bool = False,
         caption: str = "",
         frame_rate: int = 60,
+        tick_rate: int = 60,
+        dirty_rects: bool = False,
+        record: str = None,
+        replay: str = None,
+        time_source: RealTime = None,
     ):
         self.frame_rate = frame_rate
+        self.timestep = FixedStep(tick_rate)
+        self.profiler = Profiler()
         self.clock = pygame.time.Clock()
+        if replay:
+            self.input: LiveInput = InputReplay(replay)
+            self.frame_rate = 0  # replays run as fast as possible
+        elif record:
+            self.input = InputRecorder(time_source, record)
+        else:
+            self.input = LiveInput(time_source)
+        self.scheduler = Scheduler(self.get_ticks)
         pygame.init()
         pygame.mouse.set_visible(mouse_visible)
         self.screen = pygame.display.set_mode((screen_width, screen_height))
+        self.renderer: Renderer = (
+            DirtyRenderer(self.screen) if dirty_rects else Renderer(self.screen)
+        )
 
         self.images: AttrDict = (
             self._load_assets(images, pygame.image.load) if images else AttrDict()
@@ -41,17 +69,26 @@ class Game:
         return loaded
 
     def exit(self) -> None:
+        self.input.close()
         pygame.quit()
         sys.exit(0)
 
     def process_events(self, events: Mapping[int, Callable]) -> None:
         events = events or {}
-        for event in pygame.event.get():
+        for event in self.input.events():
             if event.type == pygame.QUIT:
                 self.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == self.PROFILER_KEY:
+                    self.profiler.toggle()
+                elif event.key == self.TRACE_KEY:
+                    self.profiler.export(self.TRACE_PATH)
             if func := events.get(event.type):
                 func(event)
 
+    def get_ticks(self) -> int:
+        return self.input.ticks
+
     def set_background(self, image: pygame.Surface) -> None:
         screen_width, screen_height = self.screen.get_size()
         image_width, image_height = image.get_size()
@@ -63,14 +100,42 @@ class Game:
             for y in range(tiles_y):
                 self.screen.blit(image, (image_width * x, image_height * y))
 
-    def loop(self, func: Callable, events: Mapping[int, Callable] = None) -> None:
+    def loop(
+        self,
+        func: Callable,
+        events: Mapping[int, Callable] = None,
+        update: Callable = None,
+    ) -> None:
+        """Run func once per frame until it returns a falsy value.
+
+        When update is given it runs at the fixed tick_rate, as many times
+        as the elapsed frame time requires, before func draws the frame.
+        """
         events = events or {}
         run = True
+        self.timestep.reset()
+        profiler = self.profiler
         while run:
-            self.process_events(events=events)
-            run = func(self)
-            pygame.display.flip()
-            self.clock.tick(self.frame_rate)
+            if not self.input.begin_frame():
+                self.exit()
+            with profiler.phase("events"):
+                self.process_events(events=events)
+            if update:
+                elapsed = self.input.elapsed / 1000
+                with profiler.phase("update"):
+                    for _ in range(self.timestep.advance(elapsed)):
+                        update(self)
+            with profiler.phase("func"):
+                run = func(self)
+
+            if profiler.visible:
+                profiler.draw(self.screen, budget=1 / (self.frame_rate or 60))
+                self.renderer.mark(profiler.rect)
+            with profiler.phase("flip"):
+                self.renderer.present()
+            with profiler.phase("tick"):
+                self.clock.tick(self.frame_rate)
+            profiler.end_frame()
 
     def get_image(
         self,
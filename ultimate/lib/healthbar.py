@@ -1,8 +1,9 @@
 import pygame
-from .types import Color, Coordinate
+from .types import Color
+from .widget import Widget
 
 
-class HealthBar:
+class HealthBar(Widget):
     def __init__(
         self,
         width: int,
@@ -14,6 +15,7 @@ class HealthBar:
         limit_health: int = 100,
         icon: pygame.Surface = None,
     ) -> None:
+        super().__init__()
         self.width = width
         self.height = height
         self.color = color
@@ -25,30 +27,35 @@ class HealthBar:
             icon, (height * 2, height * 2)
         ).convert_alpha()
 
+        # Lay the bar and its overhanging icon out in one surface
         self.health_rect = pygame.rect.Rect(0, 0, self.width, self.height)
+        self.icon_rect = self.icon.get_rect(
+            bottomleft=(self.width - self.icon.get_width() // 2, self.height)
+        )
+        self.bounds = self.health_rect.union(self.icon_rect)
+        self.health_rect.move_ip(-self.bounds.x, -self.bounds.y)
+        self.icon_rect.move_ip(-self.bounds.x, -self.bounds.y)
 
-    def draw(self, surface: pygame.Surface, c: Coordinate) -> None:
-        health_left = self.current_health / self.limit_health
-        health_width = int(self.width * health_left)
-
-        health_surface = pygame.Surface((health_width, self.height))
-        health_surface.fill(self.color)
-        self.health_rect.center = c
+    def anchor(self) -> pygame.Rect:
+        return self.health_rect
 
-        pygame.draw.rect(surface, self.background_color, self.health_rect)
-        pygame.draw.rect(surface, self.color, self.health_rect, self.border_width)
-        surface.blit(health_surface, self.health_rect)
+    def render(self) -> pygame.Surface:
+        health_left = self.current_health / self.limit_health
+        health_rect = self.health_rect.copy()
+        health_rect.width = int(self.width * health_left)
 
-        x, y = self.health_rect.bottomright
-        if self.icon:
-            surface.blit(
-                self.icon, (x - self.icon.get_width() // 2, y - self.icon.get_height())
-            )
+        bar = pygame.Surface(self.bounds.size, pygame.SRCALPHA, 32).convert_alpha()
+        pygame.draw.rect(bar, self.background_color, self.health_rect)
+        pygame.draw.rect(bar, self.color, self.health_rect, self.border_width)
+        bar.fill(self.color, health_rect)
+        bar.blit(self.icon, self.icon_rect)
+        return bar
 
     def add_damage(self, amount: int) -> None:
-        self.current_health -= amount
-        self.current_health = max(self.current_health, 0)
+        self.set_health(max(self.current_health - amount, 0))
 
     def set_health(self, health: int) -> None:
         health = min(health, self.limit_health)
-        self.current_health = health
+        if health != self.current_health:
+            self.current_health = health
+            self.invalidate()
@@ -0,0 +1,27 @@
+# platformer/src/loop.py is a symlink to this file; keep it import-free.
+
+
+class FixedStep:
+    """Turns variable frame times into a whole number of fixed ticks.
+
+    alpha is the fraction of a tick left over after the last advance(),
+    for interpolating between the previous and current simulation state.
+    """
+
+    def __init__(self, tick_rate: int = 60, max_steps: int = 5) -> None:
+        self.step = 1 / tick_rate
+        self.max_steps = max_steps
+        self.reset()
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, elapsed: float) -> int:
+        self.accumulator += elapsed
+        steps = int(self.accumulator // self.step)
+        self.accumulator -= steps * self.step
+        # Drop the backlog rather than spiral on a slow machine
+        steps = min(steps, self.max_steps)
+        self.alpha = self.accumulator / self.step
+        return steps
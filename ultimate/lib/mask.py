@@ -0,0 +1,12 @@
+import pygame
+from weakref import WeakKeyDictionary
+
+# One mask per source surface, dropped together with the surface
+_masks: "WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]" = WeakKeyDictionary()
+
+
+def get_mask(surface: pygame.Surface) -> pygame.mask.Mask:
+    mask = _masks.get(surface)
+    if mask is None:
+        mask = _masks[surface] = pygame.mask.from_surface(surface)
+    return mask
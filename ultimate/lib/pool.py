@@ -0,0 +1,42 @@
+import pygame
+from typing import Callable, List, Optional
+
+
+class Poolable(pygame.sprite.Sprite):
+    _pool: Optional["SpritePool"] = None
+    _pooled: bool = False
+
+    def reset(self) -> None:
+        pass
+
+    def kill(self) -> None:
+        super().kill()
+        if self._pool is not None and not self._pooled:
+            self._pool.release(self)
+
+
+class SpritePool:
+    def __init__(self, factory: Callable[[], Poolable], size: int = 0) -> None:
+        self._factory = factory
+        self._free: List[Poolable] = []
+        for _ in range(size):
+            self.release(self._create())
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def _create(self) -> Poolable:
+        sprite = self._factory()
+        sprite._pool = self
+        return sprite
+
+    def acquire(self, *groups: pygame.sprite.AbstractGroup) -> Poolable:
+        sprite = self._free.pop() if self._free else self._create()
+        sprite._pooled = False
+        sprite.reset()
+        sprite.add(*groups)
+        return sprite
+
+    def release(self, sprite: Poolable) -> None:
+        sprite._pooled = True
+        self._free.append(sprite)
@@ -0,0 +1,124 @@
+# intro/profiler.py is a symlink to this file; keep it free of
+# package-relative imports.
+
+import json
+import pygame
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, List, Sequence, Tuple
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler._record(self.name, self.start, perf_counter())
+
+
+class Profiler:
+    """Times the phases of every frame.
+
+    Keeps a rolling history per phase for the overlay, and the last
+    trace_size spans for export as a Chrome trace (chrome://tracing,
+    Perfetto). Loops without a fixed-step update can leave that phase out.
+    """
+
+    PHASES = ("events", "update", "func", "flip", "tick")
+    COLORS = {
+        "events": "deepskyblue",
+        "update": "orange",
+        "func": "limegreen",
+        "flip": "violet",
+        "tick": "gray60",
+    }
+
+    def __init__(
+        self,
+        history: int = 120,
+        trace_size: int = 100_000,
+        phases: Sequence[str] = PHASES,
+    ) -> None:
+        self.phases = tuple(phases)
+        self.history: Dict[str, Deque[float]] = {
+            name: deque([0.0] * history, maxlen=history) for name in self.phases
+        }
+        self.trace: Deque[Tuple[str, float, float]] = deque(maxlen=trace_size)
+        self.visible = False
+        self.rect = pygame.rect.Rect(0, 0, 0, 0)
+
+        self._phases = {name: _Phase(self, name) for name in self.phases}
+        self._current = dict.fromkeys(self.phases, 0.0)
+        self._frame_start = perf_counter()
+        self._origin = self._frame_start
+        self._font: pygame.font.Font = None
+
+    def phase(self, name: str) -> _Phase:
+        return self._phases[name]
+
+    def _record(self, name: str, start: float, end: float) -> None:
+        self._current[name] += end - start
+        self.trace.append((name, start, end))
+
+    def end_frame(self) -> None:
+        for name in self.phases:
+            self.history[name].append(self._current[name])
+            self._current[name] = 0.0
+        now = perf_counter()
+        self.trace.append(("frame", self._frame_start, now))
+        self._frame_start = now
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def draw(self, surface: pygame.Surface, budget: float = 1 / 60) -> None:
+        if not self.visible:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+
+        row_height, label_width = 22, 110
+        samples = len(self.history[self.phases[0]])
+        self.rect = pygame.rect.Rect(
+            0, 0, label_width + samples + 8, row_height * len(self.phases) + 8
+        )
+        self.rect.bottomleft = (4, surface.get_height() - 4)
+        overlay = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        for row, name in enumerate(self.phases):
+            color = self.COLORS.get(name, "white")
+            values = self.history[name]
+            bottom = 4 + (row + 1) * row_height - 2
+            avg = sum(values) / len(values) * 1000
+            label = self._font.render(f"{name} {avg:6.2f}ms", True, "white")
+            overlay.blit(label, (4, bottom - label.get_height()))
+            for x, value in enumerate(values, start=label_width):
+                height = min(1.0, value / budget) * (row_height - 4)
+                if height >= 1:
+                    pygame.draw.line(overlay, color, (x, bottom), (x, bottom - height))
+
+        surface.blit(overlay, self.rect)
+
+    def export(self, path: str) -> None:
+        events: List[dict] = [
+            {
+                "name": name,
+                "cat": "frame" if name == "frame" else "phase",
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 0,
+                "tid": 0,
+            }
+            for name, start, end in self.trace
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,88 @@
+import pygame
+from typing import List
+
+
+def snapshot(*groups: pygame.sprite.AbstractGroup) -> None:
+    """Keep every sprite's rect as old_rect, before a tick moves it."""
+    for group in groups:
+        for sprite in group:
+            sprite.old_rect = sprite.rect.copy()
+
+
+def interpolated(sprite: pygame.sprite.Sprite, alpha: float) -> pygame.Rect:
+    """Where to draw sprite alpha of the way from its old_rect to its rect."""
+    old = getattr(sprite, "old_rect", None)
+    if old is None or alpha >= 1:
+        return sprite.rect
+    back = 1 - alpha
+    return sprite.rect.move(
+        round((old.x - sprite.rect.x) * back), round((old.y - sprite.rect.y) * back)
+    )
+
+
+class Renderer:
+    """Redraws and presents the whole screen every frame."""
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        self.screen = screen
+
+    def background(self, image: pygame.Surface) -> None:
+        self.screen.blit(image, (0, 0))
+
+    def _blit(
+        self, group: pygame.sprite.AbstractGroup, alpha: float
+    ) -> List[pygame.Rect]:
+        return [
+            self.screen.blit(sprite.image, interpolated(sprite, alpha))
+            for sprite in group
+        ]
+
+    def draw(self, group: pygame.sprite.AbstractGroup, alpha: float = 1.0) -> None:
+        self._blit(group, alpha)
+
+    def mark(self, *rects: pygame.Rect) -> None:
+        pass
+
+    def present(self) -> None:
+        pygame.display.flip()
+
+
+class DirtyRenderer(Renderer):
+    """Erases and presents only the regions drawn in the last two frames.
+
+    The background is restored just under last frame's rects, and
+    display.update() receives those plus this frame's rects. A new
+    background image triggers a single full-screen redraw.
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        super().__init__(screen)
+        self._background: pygame.Surface = None
+        self._full = True
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+
+    def background(self, image: pygame.Surface) -> None:
+        if image is not self._background:
+            self._background = image
+            self._full = True
+
+        if self._full:
+            self.screen.blit(image, (0, 0))
+        else:
+            for rect in self._previous:
+                self.screen.blit(image, rect, rect)
+
+    def draw(self, group: pygame.sprite.AbstractGroup, alpha: float = 1.0) -> None:
+        self._current.extend(self._blit(group, alpha))
+
+    def mark(self, *rects: pygame.Rect) -> None:
+        self._current.extend(rect.copy() for rect in rects)
+
+    def present(self) -> None:
+        if self._full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._previous + self._current)
+        self._full = False
+        self._previous, self._current = self._current, []
@@ -0,0 +1,111 @@
+import json
+import time
+import pygame
+from typing import Any, Dict, Iterator, List
+from .clock import RealTime
+
+FORMAT_VERSION = 1
+
+
+def _encode(event: pygame.event.Event) -> Dict[str, Any]:
+    attrs = {}
+    for key, value in event.dict.items():
+        if isinstance(value, (bool, int, float, str)):
+            attrs[key] = value
+        elif isinstance(value, tuple) and all(
+            isinstance(v, (int, float)) for v in value
+        ):
+            attrs[key] = list(value)
+    return {"type": event.type, "attrs": attrs}
+
+
+def _decode(data: Dict[str, Any]) -> pygame.event.Event:
+    attrs = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in data["attrs"].items()
+    }
+    return pygame.event.Event(data["type"], attrs)
+
+
+class LiveInput:
+    """Events from pygame, and time from a time source (RealTime by default).
+
+    ticks is frozen at the start of the frame so everything in it sees
+    the same time; elapsed is the time since the previous frame in ms.
+    """
+
+    def __init__(self, time_source: RealTime = None) -> None:
+        self.time_source = time_source or RealTime()
+        self.ticks = 0
+        self.elapsed = 0
+        self._previous: int = None
+
+    def begin_frame(self) -> bool:
+        self.time_source.frame()
+        self.ticks = self.time_source.now()
+        if self._previous is not None:
+            self.elapsed = self.ticks - self._previous
+        self._previous = self.ticks
+        return True
+
+    def events(self) -> List[pygame.event.Event]:
+        return pygame.event.get()
+
+    def close(self) -> None:
+        pass
+
+
+class InputRecorder(LiveInput):
+    def __init__(self, time_source: RealTime, path: str) -> None:
+        super().__init__(time_source)
+        self.path = path
+        self.frames: List[list] = []
+
+    def begin_frame(self) -> bool:
+        super().begin_frame()
+        self.frames.append([self.ticks, self.elapsed, []])
+        return True
+
+    def events(self) -> List[pygame.event.Event]:
+        events = super().events()
+        self.frames[-1][2].extend(_encode(event) for event in events)
+        return events
+
+    def close(self) -> None:
+        with open(self.path, "w") as f:
+            json.dump({"version": FORMAT_VERSION, "frames": self.frames}, f)
+
+
+class InputReplay(LiveInput):
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version in {path}")
+        self.total = len(data["frames"])
+        self.frame = 0
+        self._frames: Iterator[list] = iter(data["frames"])
+        self._events: List[pygame.event.Event] = []
+        self._started = time.perf_counter()
+        self.seconds = 0.0  # wall time spent replaying, set by close()
+
+    def begin_frame(self) -> bool:
+        try:
+            self.ticks, self.elapsed, events = next(self._frames)
+        except StopIteration:
+            return False
+        self._events = [_decode(event) for event in events]
+        self.frame += 1
+        return True
+
+    def events(self) -> List[pygame.event.Event]:
+        # Live input is ignored, except for closing the window
+        events = self._events + [
+            event for event in pygame.event.get() if event.type == pygame.QUIT
+        ]
+        self._events = []
+        return events
+
+    def close(self) -> None:
+        self.seconds = time.perf_counter() - self._started
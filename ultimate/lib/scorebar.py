@@ -1,9 +1,9 @@
 import pygame
 from typing import List
-from .types import Coordinate
+from .widget import Widget
 
 
-class ScoreBar:
+class ScoreBar(Widget):
     def __init__(
         self,
         width: int,
@@ -11,6 +11,7 @@ class ScoreBar:
         digits: List[pygame.Surface],
         max_digits: int = 3,
     ) -> None:
+        super().__init__()
         self.width = width
         self.height = height
         self.digits = [
@@ -20,24 +21,19 @@ class ScoreBar:
         self.max_digits = max_digits
         self.max_value = int(self.max_digits * "9")
         self.value = 0
-        self.bar_rect = pygame.rect.Rect(
-            0, 0, self.max_digits * self.width, self.height
-        )
 
-    def draw(self, surface: pygame.Surface, c: Coordinate) -> None:
+    def render(self) -> pygame.Surface:
         bar_width = self.max_digits * self.width
         bar_surface = pygame.Surface(
             (bar_width, self.height), pygame.SRCALPHA, 32
         ).convert_alpha()
-        value_str = str(self.value)
-        value_str = (self.max_digits - len(value_str)) * "0" + value_str
+        value_str = str(self.value).zfill(self.max_digits)
         for idx, d in enumerate(value_str):
-            d = int(d)
-            bar_surface.blit(self.digits[d], (idx * self.width - 10 * idx, 0))
-
-        self.bar_rect.center = c
-        pygame.draw.rect(surface, (255, 255, 255), self.bar_rect, -1)
-        surface.blit(bar_surface, self.bar_rect)
+            bar_surface.blit(self.digits[int(d)], (idx * self.width - 10 * idx, 0))
+        return bar_surface
 
     def add(self, v: int) -> None:
-        self.value = min(self.max_value, self.value + v)
+        value = min(self.max_value, self.value + v)
+        if value != self.value:
+            self.value = value
+            self.invalidate()
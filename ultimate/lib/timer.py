@@ -1,27 +1,79 @@
+# platformer/src/timer.py is a symlink to this file; keep it free of
+# package-relative imports.
+
+import heapq
 import pygame
-from typing import Callable
+from itertools import count
+from typing import Callable, List, Optional, Tuple
+
+
+class Scheduler:
+    """Fires timers from a min-heap of deadlines.
+
+    tick() only touches the timers that are due, so idle timers cost
+    nothing per frame. Deactivated timers are dropped lazily when their
+    stale entry reaches the top of the heap.
+    """
+
+    def __init__(self, clock: Callable[[], int] = pygame.time.get_ticks) -> None:
+        self.clock = clock
+        self._heap: List[Tuple[int, int, "Timer", int]] = []
+        self._order = count()
+
+    def schedule(self, timer: "Timer", deadline: int) -> None:
+        heapq.heappush(
+            self._heap, (deadline, next(self._order), timer, timer._generation)
+        )
+
+    def tick(self) -> None:
+        now = self.clock()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, timer, generation = heapq.heappop(heap)
+            if generation == timer._generation:
+                timer._fire(now)
+
+    def __len__(self) -> int:
+        return len(self._heap)
 
 
 class Timer:
-    def __init__(self, func: Callable, second: int) -> None:
-        self._threshold = second * 1000
-        self._last_trigger = 0
-        self._func = func
-        self._pause = True
-
-    @property
-    def current_time(self) -> int:
-        return pygame.time.get_ticks()
-
-    def tick(self):
-        if not self._pause and (
-            self.current_time - self._last_trigger >= self._threshold
-        ):
-            self._func()
-            self._last_trigger = self.current_time
-
-    def stop(self) -> None:
-        self._pause = True
-
-    def start(self) -> None:
-        self._pause = False
+    """Runs func duration ms after activate(), and every duration ms if repeat.
+
+    active stays True while the timer counts down, until it fires for the
+    last time or is deactivated.
+    """
+
+    def __init__(
+        self,
+        duration: int,
+        scheduler: Scheduler,
+        func: Optional[Callable[[], None]] = None,
+        repeat: bool = False,
+    ) -> None:
+        self.duration = duration
+        self.scheduler = scheduler
+        self.func = func
+        self.repeat = repeat
+        self.active = False
+        self._generation = 0
+
+    def activate(self) -> None:
+        self._start(self.scheduler.clock())
+
+    def deactivate(self) -> None:
+        self.active = False
+        self._generation += 1
+
+    def _start(self, now: int) -> None:
+        self.active = True
+        self._generation += 1
+        self.scheduler.schedule(self, now + self.duration)
+
+    def _fire(self, now: int) -> None:
+        if self.repeat:
+            self._start(now)
+        else:
+            self.deactivate()
+        if self.func:
+            self.func()
@@ -0,0 +1,34 @@
+import pygame
+from typing import Optional
+from .types import Coordinate
+
+
+class Widget:
+    """Keeps its rendered surface until invalidate() is called."""
+
+    def __init__(self) -> None:
+        self._surface: Optional[pygame.Surface] = None
+        self._anchor = pygame.rect.Rect(0, 0, 0, 0)
+        self.rect = pygame.rect.Rect(0, 0, 0, 0)
+
+    def render(self) -> pygame.Surface:
+        raise NotImplementedError()
+
+    def anchor(self) -> pygame.Rect:
+        """Area of the rendered surface that is centered on draw."""
+        return self._surface.get_rect()
+
+    def invalidate(self) -> None:
+        self._surface = None
+
+    def draw(self, surface: pygame.Surface, c: Coordinate) -> None:
+        if self._surface is None:
+            self._surface = self.render()
+            self._anchor = self.anchor()
+            self.rect.size = self._surface.get_size()
+
+        self.rect.topleft = (
+            c[0] - self._anchor.centerx,
+            c[1] - self._anchor.centery,
+        )
+        surface.blit(self._surface, self.rect)
@@ -1,8 +1,11 @@
 import sys
+import math
+import argparse
 import pygame
-from typing import Dict, Tuple, Callable
+from typing import Dict, Tuple, Callable, Mapping
 from enum import IntEnum
 from lib.asset import Static, Text
+from lib.atlas import Atlas
 from lib.game import Game
 from lib.types import AttrDict, Coordinate
 from functools import cache
@@ -12,6 +15,9 @@ from lib.healthbar import HealthBar
 from lib.scorebar import ScoreBar
 from lib.button import Button
 from lib.timer import Timer
+from lib.pool import SpritePool
+from lib.render import snapshot
+from lib.clock import RealTime, FixedStepTime, AcceleratedTime
 
 SPRITESHEET_BG = (94, 129, 162)
 
@@ -81,6 +87,7 @@ class Ultimate(Game):
 
     def init(self) -> None:
         self.game_font = pygame.font.Font(None, self.char_height)
+        self.init_atlas()
         self.init_buttons()
         self.init_hud()
 
@@ -88,18 +95,14 @@ class Ultimate(Game):
         self.player = pygame.sprite.GroupSingle(self.make_player())
 
         self.monster_group = pygame.sprite.Group()
-        self.timers.append(
-            Timer(
-                self.spawn_snail,
-                second=2,
-            )
+        self.snail_pool = SpritePool(
+            lambda: self.make_snail(self.player.sprite, self.scorebar), size=3
         )
-        self.timers.append(
-            Timer(
-                self.spawn_fly,
-                second=3,
-            )
+        self.fly_pool = SpritePool(
+            lambda: self.make_fly(self.player.sprite, self.scorebar), size=2
         )
+        self.timers.append(Timer(2000, self.scheduler, self.spawn_snail, repeat=True))
+        self.timers.append(Timer(3000, self.scheduler, self.spawn_fly, repeat=True))
 
     def get_background(self, bg: Background) -> pygame.Surface:
         background_width: int = 231
@@ -134,81 +137,70 @@ class Ultimate(Game):
         return self._draw_shape(width, height, shape, terrain_tiles)
 
     def start_timers(self) -> None:
-        [t.start() for t in self.timers]
-
-    def tick_timers(self) -> None:
-        [t.tick() for t in self.timers]
+        for timer in self.timers:
+            timer.activate()
 
     def stop_timers(self) -> None:
-        [t.stop() for t in self.timers]
+        for timer in self.timers:
+            timer.deactivate()
 
     def spawn_snail(self) -> None:
-        snail = self.make_snail(self.player.sprite, self.scorebar)
+        snail = self.snail_pool.acquire(self.monster_group)
         snail.start_at(self.ground.sprite.rect.topright)
-        self.monster_group.add(snail)
 
     def make_snail(self, player, score) -> Snail:
-        snail_images = {
-            Snail.State.RUN1.value: pygame.transform.scale(
-                self.get_from_spritesheet(13, 15), (60, 60)
-            ),
-            Snail.State.RUN2.value: pygame.transform.scale(
-                self.get_from_spritesheet(14, 15), (60, 60)
-            ),
-            Snail.State.HATCHED.value: pygame.transform.scale(
-                self.get_from_spritesheet(15, 15), (60, 60)
-            ),
-            Snail.State.DEAD.value: pygame.transform.scale(
-                self.get_from_spritesheet(16, 15), (60, 60)
-            ),
-        }
-        return Snail(player, score, snail_images, Snail.State.RUN1, speed=(-3, 0))
+        return Snail(player, score, self.snail_images, Snail.State.RUN1, speed=(-3, 0))
 
     def spawn_fly(self) -> None:
-        fly = self.make_fly(self.player.sprite, self.scorebar)
+        fly = self.fly_pool.acquire(self.monster_group)
         x, y = self.ground.sprite.rect.topright
         fly.start_at((x, y - 20))
-        self.monster_group.add(fly)
 
     def make_fly(self, player, score) -> Fly:
-        fly_images = {
-            Snail.State.RUN1.value: pygame.transform.scale(
-                self.get_from_spritesheet(13, 14), (60, 60)
-            ),
-            Snail.State.RUN2.value: pygame.transform.scale(
-                self.get_from_spritesheet(14, 14), (60, 60)
-            ),
-            Snail.State.DEAD.value: pygame.transform.scale(
-                self.get_from_spritesheet(15, 14), (60, 60)
-            ),
-        }
         return Fly(
             player,
             score,
-            fly_images,
+            self.fly_images,
             Fly.State.RUN1,
             speed=(-5, 0),
             run_animation_speed=5,
         )
 
     def make_player(self) -> Player:
-        player_images = {
-            str(value): pygame.transform.scale(
-                self.get_from_spritesheet(value, 0), (70, 70)
-            )
-            for value in Player.State
-        }
-        return Player(player_images, str(Player.State.IDLE))
+        return Player(self.player_images, str(Player.State.IDLE))
 
     def get_from_spritesheet(self, x: int, y: int) -> pygame.Surface:
-        return self.get_image(
+        return self.atlas.get((x, y))
+
+    def init_atlas(self) -> None:
+        self.atlas = Atlas(
             self.images.spritesheet,
             size=TILE_SIZE,
-            frame=(x, y),
             start_at=TILE_START_AT,
             margin=TILE_MARGIN,
             color=SPRITESHEET_BG,
-        ).convert_alpha()
+            precompute_masks=True,
+        )
+        self.snail_images: Mapping[str, pygame.Surface] = self.atlas.frames(
+            {
+                Snail.State.RUN1.value: (13, 15),
+                Snail.State.RUN2.value: (14, 15),
+                Snail.State.HATCHED.value: (15, 15),
+                Snail.State.DEAD.value: (16, 15),
+            },
+            scale=(60, 60),
+        )
+        self.fly_images: Mapping[str, pygame.Surface] = self.atlas.frames(
+            {
+                Fly.State.RUN1.value: (13, 14),
+                Fly.State.RUN2.value: (14, 14),
+                Fly.State.DEAD.value: (15, 14),
+            },
+            scale=(60, 60),
+        )
+        self.player_images: Mapping[str, pygame.Surface] = self.atlas.frames(
+            {str(value): (value, 0) for value in Player.State}, scale=(70, 70)
+        )
 
     @cache
     def _get_terrain_tiles(
@@ -313,11 +305,12 @@ class Ultimate(Game):
         def _run_menu(self) -> bool:
             if self.stage is not None:
                 return False
-            self.screen.blit(background, (0, 0))
+            self.renderer.background(background)
             pygame.mouse.set_visible(True)
 
             self.start_game_button.draw(self.screen, (400, 200))
             self.exit_game_button.draw(self.screen, (400, 300))
+            self.renderer.mark(self.start_game_button.rect, self.exit_game_button.rect)
             return True
 
         events = {
@@ -333,23 +326,18 @@ class Ultimate(Game):
         ground_pos_y = self.screen.get_height() - self.ground.sprite.rect.height
         self.ground.sprite.rect.topleft = (0, ground_pos_y)
         self.ground.sprite.set_state(str(stage_config.terrain))
+        # The ground never moves during a stage
+        self.ground.draw(background)
 
         self.player.sprite.rect.bottomleft = (20, ground_pos_y)
         self.player.sprite.ground = self.ground
 
+        snapshot(self.player, self.monster_group)
         self.start_timers()
 
-        def _run(self) -> None:
-            self.tick_timers()
-
-            self.screen.blit(background, (0, 0))
-
-            self.ground.draw(self.screen)
-            self.healthbar.draw(self.screen, (50, 30))
-            self.scorebar.draw(self.screen, (self.screen.get_width() - 50, 30))
-
-            self.player.draw(self.screen)
-            self.monster_group.draw(self.screen)
+        def _update(self) -> None:
+            self.scheduler.tick()
+            snapshot(self.player, self.monster_group)
 
             self.player.update()
             self.monster_group.update()
@@ -358,12 +346,24 @@ class Ultimate(Game):
             if self.player.sprite.health <= 0:
                 self.stop_timers()
                 raise GameOver()
+
+        def _draw(self) -> bool:
+            self.renderer.background(background)
+
+            self.healthbar.draw(self.screen, (50, 30))
+            self.scorebar.draw(self.screen, (self.screen.get_width() - 50, 30))
+            self.renderer.mark(self.healthbar.rect, self.scorebar.rect)
+
+            # Draw between the last two ticks, however far into the next one
+            alpha = self.timestep.alpha
+            self.renderer.draw(self.player, alpha)
+            self.renderer.draw(self.monster_group, alpha)
             return True
 
         events = {
             pygame.KEYDOWN: self.player.sprite.action,
         }
-        self.loop(_run, events=events)
+        self.loop(_draw, events=events, update=_update)
 
     def run_game_over(self) -> None:
         background = self.get_background(Background.SKY)
@@ -377,13 +377,14 @@ class Ultimate(Game):
             if self.stage is not None:
                 return False
 
-            self.screen.blit(background, (0, 0))
+            self.renderer.background(background)
             pygame.mouse.set_visible(True)
 
-            self.game_over.draw(self.screen)
+            self.renderer.draw(self.game_over)
 
             self.retry_game_button.draw(self.screen, (400, 200))
             self.exit_game_button.draw(self.screen, (400, 300))
+            self.renderer.mark(self.retry_game_button.rect, self.exit_game_button.rect)
             return True
 
         self.loop(
@@ -409,5 +410,44 @@ images = {
     "spritesheet": "assets/spritesheet.png",
     "backgrounds": "assets/backgrounds.png",
 }
-game = Ultimate(screen_width, screen_height, images=images)
-game.run()
+parser = argparse.ArgumentParser()
+parser.add_argument("--record", help="save the session's input to this file")
+parser.add_argument("--replay", help="replay a recorded session as fast as possible")
+parser.add_argument(
+    "--speed", type=float, default=1.0, help="run game time this many times faster"
+)
+parser.add_argument(
+    "--fast-forward",
+    action="store_true",
+    help="advance a fixed 1/60 s of game time per frame, uncapped",
+)
+args = parser.parse_args()
+
+if args.fast_forward:
+    time_source = FixedStepTime(1000 / 60)
+elif args.speed != 1.0:
+    time_source = AcceleratedTime(args.speed)
+else:
+    time_source = RealTime()
+
+game = Ultimate(
+    screen_width,
+    screen_height,
+    images=images,
+    dirty_rects=True,
+    record=args.record,
+    replay=args.replay,
+    time_source=time_source,
+    frame_rate=0 if args.fast_forward else 60,
+)
+# Let the simulation catch up with accelerated time instead of dropping ticks
+game.timestep.max_steps *= max(1, math.ceil(args.speed))
+try:
+    game.run()
+finally:
+    if args.replay:
+        replay = game.input
+        print(
+            f"Replayed {replay.frame}/{replay.total} frames in {replay.seconds:.2f}s "
+            f"({replay.frame / max(replay.seconds, 1e-9):.0f} fps)"
+        )
@@ -2,13 +2,14 @@ import pygame
 from itertools import cycle
 from typing import Dict, Tuple
 from lib.asset import Static
+from lib.pool import Poolable
 from enum import StrEnum
 from lib.types import Coordinate
 from player import Player
 from lib.scorebar import ScoreBar
 
 
-class Monster(Static):
+class Monster(Poolable, Static):
     def __init__(
         self,
         player: Player,
@@ -20,6 +21,7 @@ class Monster(Static):
         run_animation_speed: int = 20,
     ) -> None:
         super().__init__(images, state)
+        self.start_state = state
         self.player = player
         self.score = score
         self.speed_x, self.speed_y = speed
@@ -27,6 +29,10 @@ class Monster(Static):
         self.current_frame = 0
         self.run_animation_speed = run_animation_speed
 
+    def reset(self) -> None:
+        self.current_frame = 0
+        self.set_state(self.start_state)
+
     def start_at(self, c: Coordinate) -> None:
         self.rect.bottomleft = c
 
@@ -88,6 +94,11 @@ class Fly(Monster):
 
     run_cycle = cycle([State.RUN1, State.RUN2])
 
+    def reset(self) -> None:
+        super().reset()
+        self._current = Fly._current
+        self._direction = Fly._direction
+
     def move(self) -> None:
         self._check_borders()
         self._run_animation()